@@ -6,18 +6,55 @@ with zero endpoint logic. Behavior is defined by schemas and link metadata
 (FromInput, DateRangeFrom, WhenInput, ComputedFrom, or custom via register_link).
 """
 
-from semblance.api import SemblanceAPI
-from semblance.links import (
-    ComputedFrom,
-    DateRangeFrom,
-    FromCookie,
-    FromHeader,
-    FromInput,
-    WhenInput,
-)
-from semblance.pagination import PageParams, PaginatedResponse
-from semblance.plugins import LinkProtocol, register_link
-from semblance.testing import test_client
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from semblance.api import SemblanceAPI
+    from semblance.links import (
+        ComputedFrom,
+        DateRangeFrom,
+        FromCookie,
+        FromHeader,
+        FromInput,
+        WhenInput,
+    )
+    from semblance.pagination import PageParams, PaginatedResponse
+    from semblance.plugins import LinkProtocol, register_link
+    from semblance.testing import test_client
+
+# Public names are imported on first access so that lightweight entry points
+# (e.g. `semblance init`, `semblance --help`) do not pay the FastAPI import cost.
+_LAZY_EXPORTS = {
+    "ComputedFrom": "semblance.links",
+    "DateRangeFrom": "semblance.links",
+    "FromCookie": "semblance.links",
+    "FromHeader": "semblance.links",
+    "FromInput": "semblance.links",
+    "LinkProtocol": "semblance.plugins",
+    "PageParams": "semblance.pagination",
+    "PaginatedResponse": "semblance.pagination",
+    "register_link": "semblance.plugins",
+    "SemblanceAPI": "semblance.api",
+    "test_client": "semblance.testing",
+    "WhenInput": "semblance.links",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ComputedFrom",
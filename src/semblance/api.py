@@ -10,19 +10,27 @@ generates responses from schemas and link metadata.
 import asyncio
 import random
 import re
-from collections.abc import Callable
-from typing import Annotated, Any, get_origin
+from collections.abc import Callable, Sequence
+from operator import attrgetter
+from typing import Annotated, Any, NamedTuple, TypeVar, cast, get_origin
 
 from fastapi import Body, FastAPI, HTTPException, Query, Request
-from fastapi.responses import Response
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
 
 from semblance.config import load_config
 from semblance.factory import build_response, validate_response
+from semblance.plugins import registry_generation
 from semblance.rate_limit import get_limiter
-from semblance.state import StatefulStore
+from semblance.resolver import _InputProxy, get_output_model_for_type
+from semblance.state import StatefulStore, _has_non_finite_float
 from semblance.validation import validate_specs
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 
 def _parse_path_params(path: str) -> list[str]:
     """Extract path param names from template, e.g. '/users/{id}' -> ['id']."""
@@ -34,6 +42,24 @@ def _collection_path(path_template: str) -> str:
     return re.sub(r"/\{\w+\}$", "", path_template)
 
 
+_T = TypeVar("_T")
+
+
+class _ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (semblance[fast]), used as the app default."""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            body = orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().render(content)  # e.g. integers beyond 64 bits
+        # orjson writes NaN/inf as null where JSONResponse raises ValueError;
+        # only bodies containing null can hide one, so only those are checked.
+        if b"null" in body and _has_non_finite_float(content):
+            return super().render(content)
+        return body
+
+
 class EndpointSpec:
     """Stored spec for a single endpoint."""
 
@@ -93,6 +119,119 @@ class EndpointSpec:
         self.tags = tags
 
 
+class _HandlerPlan(NamedTuple):
+    """Per-endpoint values a request handler reads, precomputed at registration."""
+
+    input_model: type[BaseModel]
+    output_annotation: Any
+    list_count: int | str
+    seed_from: str | None
+    error_rate: float
+    error_codes: tuple[int, ...]
+    latency_ms: float
+    jitter_ms: float
+    filter_by: str | None
+    path: str
+    output_is_list: bool
+    id_field: str | None
+    collection_path: str
+    # Model the response must be exactly (per item for lists) to be serialized
+    # directly with response_adapter; None disables direct serialization.
+    output_model: type[BaseModel] | None
+    response_adapter: TypeAdapter[Any] | None
+    # Branches handlers can skip for this route, decided once at registration.
+    rate_limited: bool
+    simulates_latency: bool
+    # list_count already clamped when it is a constant; None reads the input.
+    fixed_list_count: int | None
+    # Readers for seed_from / list_count fields declared as plain int, which
+    # need no coercion per request; None uses the coercing fallback.
+    seed_getter: Callable[[BaseModel], Any] | None
+    list_count_getter: Callable[[BaseModel], Any] | None
+
+
+def _int_field_getter(
+    model: type[BaseModel], name: str | None
+) -> Callable[[BaseModel], Any] | None:
+    """Return an attrgetter for name if model declares it as a plain int field."""
+    if name is None or name not in model.model_fields:
+        return None
+    if model.model_fields[name].annotation is not int:
+        return None
+    return attrgetter(name)
+
+
+def _build_handler_plan(spec: EndpointSpec) -> _HandlerPlan:
+    """Freeze spec fields and derived path/store info into a single plan."""
+    path_param_names = _parse_path_params(spec.path)
+    output_is_list = get_origin(spec.output_annotation) is list
+    output_model = (
+        get_output_model_for_type(spec.output_annotation)
+        if spec.output_annotation is not None
+        else None
+    )
+    if output_model is not None and not output_is_list:
+        # Only a bare model annotation is serialized directly.
+        if output_model is not spec.output_annotation:
+            output_model = None
+    return _HandlerPlan(
+        input_model=spec.input_model,
+        output_annotation=spec.output_annotation,
+        list_count=spec.list_count,
+        seed_from=spec.seed_from,
+        error_rate=spec.error_rate,
+        error_codes=tuple(spec.error_codes),
+        latency_ms=spec.latency_ms,
+        jitter_ms=spec.jitter_ms,
+        filter_by=spec.filter_by,
+        path=spec.path,
+        output_is_list=output_is_list,
+        id_field=path_param_names[0] if path_param_names else None,
+        collection_path=_collection_path(spec.path),
+        output_model=output_model,
+        response_adapter=TypeAdapter(spec.output_annotation) if output_model else None,
+        rate_limited=spec.rate_limit is not None and spec.rate_limit > 0,
+        simulates_latency=spec.latency_ms > 0 or spec.jitter_ms > 0,
+        fixed_list_count=(
+            max(1, spec.list_count) if isinstance(spec.list_count, int) else None
+        ),
+        seed_getter=_int_field_getter(spec.input_model, spec.seed_from),
+        list_count_getter=(
+            _int_field_getter(spec.input_model, spec.list_count)
+            if isinstance(spec.list_count, str)
+            else None
+        ),
+    )
+
+
+def _render(plan: _HandlerPlan, response: _T) -> _T:
+    """
+    Return response pre-serialized as JSON when it is exactly the declared type.
+
+    Generated responses are instances of the output model, so FastAPI's
+    response_model validation and jsonable_encoder pass are redundant; the
+    route's TypeAdapter serializes them in one pydantic-core call. Anything
+    else (e.g. a stored item of another model) is returned unchanged for
+    FastAPI to convert, as is a response holding NaN or infinite floats.
+    """
+    model = plan.output_model
+    if model is None or plan.response_adapter is None:
+        return response
+    if plan.output_is_list:
+        if type(response) is not list or any(type(i) is not model for i in response):
+            return response
+    elif type(response) is not model:
+        return response
+    payload = plan.response_adapter.dump_json(response, by_alias=True)
+    # pydantic writes NaN/inf as null; leave those for FastAPI to reject.
+    if b"null" in payload and _has_non_finite_float(
+        plan.response_adapter.dump_python(response)
+    ):
+        return response
+    # FastAPI sends a returned Response as-is; it stands in for the value.
+    return cast(_T, Response(payload, media_type="application/json"))
+
+
 class SemblanceAPI:
     """
     Core API builder. Register endpoints with input/output models;
@@ -136,6 +275,9 @@ class SemblanceAPI:
             getattr(cfg, "verbose_errors", False) if cfg else False
         )
         self._middleware: list[tuple[type[Any], dict[str, Any]]] = []
+        # Last app built by as_fastapi and the link registry generation it saw.
+        self._app: FastAPI | None = None
+        self._app_generation = -1
 
     @classmethod
     def from_config(
@@ -412,6 +554,7 @@ class SemblanceAPI:
         tags: list[str] | None = None,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self._app = None
             self._specs.append(
                 EndpointSpec(
                     path=path,
@@ -438,6 +581,7 @@ class SemblanceAPI:
 
     def add_middleware(self, middleware_class: type[Any], **kwargs: Any) -> None:
         """Register a FastAPI/Starlette middleware. First added is outermost."""
+        self._app = None
         self._middleware.append((middleware_class, kwargs))
 
     def mount_into(self, app: FastAPI, path_prefix: str = "/") -> None:
@@ -447,12 +591,24 @@ class SemblanceAPI:
         app.mount(prefix, sub_app)
 
     def as_fastapi(self) -> FastAPI:
-        """Build and return a FastAPI application with all registered endpoints."""
+        """
+        Build and return a FastAPI application with all registered endpoints.
+
+        The app is cached: repeated calls return the same instance until an
+        endpoint or middleware is registered (or a custom link type, which
+        can change link validation).
+        """
+        generation = registry_generation()
+        if self._app is not None and self._app_generation == generation:
+            return self._app
         if self._validate_links:
             link_errors = validate_specs(self._specs)
             if link_errors:
                 raise ValueError("Link validation failed:\n" + "\n".join(link_errors))
-        app = FastAPI()
+        if orjson is not None:
+            app = FastAPI(default_response_class=_ORJSONResponse)
+        else:
+            app = FastAPI()
         for mw_class, mw_kwargs in self._middleware:
             app.add_middleware(mw_class, **mw_kwargs)  # type: ignore[arg-type]
         seen: set[tuple[str, str]] = set()
@@ -477,16 +633,25 @@ class SemblanceAPI:
                 elif method == "DELETE":
                     self._register_delete(app, spec)
 
+        self._app = app
+        self._app_generation = generation
         return app
 
     def _resolve_seed(
-        self, seed_from: str | None, input_instance: BaseModel
+        self,
+        seed_from: str | None,
+        input_instance: BaseModel,
+        getter: Callable[[BaseModel], Any] | None = None,
     ) -> int | None:
-        """Resolve seed from API default or input field."""
+        """Resolve seed from API default or input field (read via getter if given)."""
         if self._seed is not None:
             return self._seed
+        if getter is not None:
+            val = getter(input_instance)
+            if type(val) is int:
+                return val
         if seed_from:
-            val = input_instance.model_dump().get(seed_from)
+            val = _InputProxy(input_instance).get(seed_from)
             if val is not None:
                 try:
                     return int(val)
@@ -505,7 +670,7 @@ class SemblanceAPI:
             await asyncio.sleep(duration)
 
     def _maybe_raise_error(
-        self, error_rate: float, error_codes: list[int], seed: int | None
+        self, error_rate: float, error_codes: Sequence[int], seed: int | None
     ) -> None:
         """With probability error_rate, raise HTTPException."""
         if error_rate <= 0:
@@ -516,12 +681,19 @@ class SemblanceAPI:
             raise HTTPException(status_code=code, detail="Simulated error")
 
     def _resolve_list_count(
-        self, list_count: int | str, input_instance: BaseModel
+        self,
+        list_count: int | str,
+        input_instance: BaseModel,
+        getter: Callable[[BaseModel], Any] | None = None,
     ) -> int:
         """Resolve list_count to int; when str, use input field value."""
         if isinstance(list_count, int):
             return max(1, list_count)
-        val = input_instance.model_dump().get(list_count, 5)
+        if getter is not None:
+            val = getter(input_instance)
+            if type(val) is int:
+                return max(1, val)
+        val = _InputProxy(input_instance).get(list_count, 5)
         try:
             n = int(val) if val is not None else 5
             return max(1, n)
@@ -558,361 +730,283 @@ class SemblanceAPI:
                 responses[code] = {"description": "Simulated error"}
         return responses
 
+    def _not_found(
+        self, collection_path: str, id_field: str, id_value: Any
+    ) -> HTTPException:
+        """Build the stateful 404, with store details when verbose_errors is set."""
+        detail: str | dict[str, Any] = "Not found"
+        if self._verbose_errors:
+            detail = {
+                "detail": "Not found",
+                "collection": collection_path,
+                "id_field": id_field,
+                "id_value": id_value,
+            }
+        return HTTPException(status_code=404, detail=detail)
+
     def _register_get(self, app: FastAPI, spec: EndpointSpec) -> None:
-        input_model = spec.input_model
-        output_annotation = spec.output_annotation
-        list_count = spec.list_count
-        seed_from = spec.seed_from
-        error_rate = spec.error_rate
-        error_codes = spec.error_codes
-        latency_ms = spec.latency_ms
-        jitter_ms = spec.jitter_ms
-        filter_by = spec.filter_by
+        plan = _build_handler_plan(spec)
+        input_model = plan.input_model
+        output_annotation = plan.output_annotation
         store = self._store
-        path = spec.path
+        item_model = (
+            get_output_model_for_type(output_annotation)
+            if plan.output_is_list
+            else None
+        )
 
         async def handler(
             request: Request,
             query: Annotated[input_model, Query()],
         ) -> output_annotation:
-            assert output_annotation is not None
-            self._check_rate_limit(spec)
+            assert plan.output_annotation is not None
+            if plan.rate_limited:
+                self._check_rate_limit(spec)
             merged = self._merge_path_params(
-                input_model, query, dict(request.path_params)
+                plan.input_model, query, request.path_params
             )
-            seed = self._resolve_seed(seed_from, merged)
-            self._maybe_raise_error(error_rate, error_codes, seed)
-            await self._await_latency(latency_ms, jitter_ms)
+            seed = self._resolve_seed(plan.seed_from, merged, plan.seed_getter)
+            if plan.error_rate > 0:
+                self._maybe_raise_error(plan.error_rate, plan.error_codes, seed)
+            if plan.simulates_latency:
+                await self._await_latency(plan.latency_ms, plan.jitter_ms)
             response: BaseModel | list[BaseModel]
-            if store is not None and get_origin(output_annotation) is list:
-                response = store.get_all(path)
+            if store is not None and plan.output_is_list:
                 if self._validate_responses:
-                    validate_response(output_annotation, response)
-                return response
-            if store is not None and get_origin(output_annotation) is not list:
-                path_param_names = _parse_path_params(path)
-                if path_param_names:
-                    path_params = dict(request.path_params)
-                    collection_path = _collection_path(path)
-                    id_field = path_param_names[0]
-                    id_value = path_params.get(id_field)
-                    if id_value is not None:
-                        item = store.get_by_id(collection_path, id_value, id_field)
-                        if item is not None:
-                            if self._validate_responses:
-                                validate_response(output_annotation, item)
-                            return item
-                        detail: str | dict[str, Any] = "Not found"
-                        if self._verbose_errors:
-                            detail = {
-                                "detail": "Not found",
-                                "collection": collection_path,
-                                "id_field": id_field,
-                                "id_value": id_value,
-                            }
-                        raise HTTPException(status_code=404, detail=detail)
-            count = self._resolve_list_count(list_count, merged)
+                    validate_response(plan.output_annotation, store.get_all(plan.path))
+                if item_model is not None:
+                    payload = store.get_all_json(plan.path, item_model)
+                    if payload is not None:
+                        # Serialized once per change to the collection.
+                        return Response(payload, media_type="application/json")
+                return store.get_all(plan.path)
+            if store is not None and plan.id_field is not None:
+                id_value = request.path_params.get(plan.id_field)
+                if id_value is not None:
+                    item = store.get_by_id(
+                        plan.collection_path, id_value, plan.id_field
+                    )
+                    if item is None:
+                        raise self._not_found(
+                            plan.collection_path, plan.id_field, id_value
+                        )
+                    if self._validate_responses:
+                        validate_response(plan.output_annotation, item)
+                    return _render(plan, item)
+            count = plan.fixed_list_count or self._resolve_list_count(
+                plan.list_count, merged, plan.list_count_getter
+            )
             response = build_response(
-                output_annotation,
-                input_model,
+                plan.output_annotation,
+                plan.input_model,
                 merged,
                 list_count=count,
                 seed=seed,
-                filter_by=filter_by,
+                filter_by=plan.filter_by,
                 request=request,
             )
             if self._validate_responses:
-                validate_response(output_annotation, response)
-            return response
+                validate_response(plan.output_annotation, response)
+            return _render(plan, response)
 
-        kwargs: dict[str, Any] = {"response_model": output_annotation}
-        extra = self._openapi_responses(spec)
-        if extra:
-            kwargs["responses"] = extra
-        if spec.summary is not None:
-            kwargs["summary"] = spec.summary
-        if spec.description is not None:
-            kwargs["description"] = spec.description
-        if spec.tags is not None:
-            kwargs["tags"] = spec.tags
-        app.get(spec.path, **kwargs)(handler)
+        app.get(spec.path, **self._route_kwargs(spec))(handler)
 
     def _register_post(self, app: FastAPI, spec: EndpointSpec) -> None:
         assert spec.output_annotation is not None
-        input_model = spec.input_model
-        output_annotation = spec.output_annotation
-        list_count = spec.list_count
-        seed_from = spec.seed_from
-        error_rate = spec.error_rate
-        error_codes = spec.error_codes
-        latency_ms = spec.latency_ms
-        jitter_ms = spec.jitter_ms
-        filter_by = spec.filter_by
+        plan = _build_handler_plan(spec)
+        input_model = plan.input_model
+        output_annotation = plan.output_annotation
         store = self._store
-        path = spec.path
 
         async def handler(
             request: Request,
             body: input_model,
         ) -> output_annotation:
-            self._check_rate_limit(spec)
+            if plan.rate_limited:
+                self._check_rate_limit(spec)
             merged = self._merge_path_params(
-                input_model, body, dict(request.path_params)
+                plan.input_model, body, request.path_params
+            )
+            seed = self._resolve_seed(plan.seed_from, merged, plan.seed_getter)
+            if plan.error_rate > 0:
+                self._maybe_raise_error(plan.error_rate, plan.error_codes, seed)
+            if plan.simulates_latency:
+                await self._await_latency(plan.latency_ms, plan.jitter_ms)
+            count = plan.fixed_list_count or self._resolve_list_count(
+                plan.list_count, merged, plan.list_count_getter
             )
-            seed = self._resolve_seed(seed_from, merged)
-            self._maybe_raise_error(error_rate, error_codes, seed)
-            await self._await_latency(latency_ms, jitter_ms)
-            count = self._resolve_list_count(list_count, merged)
             response: BaseModel | list[BaseModel] = build_response(
-                output_annotation,
-                input_model,
+                plan.output_annotation,
+                plan.input_model,
                 merged,
                 list_count=count,
                 seed=seed,
-                filter_by=filter_by,
+                filter_by=plan.filter_by,
                 request=request,
             )
             if store is not None and not isinstance(response, list):
-                response = store.add(path, response)
+                response = store.add(plan.path, response)
             if self._validate_responses:
-                validate_response(output_annotation, response)
-            return response
+                validate_response(plan.output_annotation, response)
+            return _render(plan, response)
 
-        kwargs: dict[str, Any] = {"response_model": output_annotation}
-        extra = self._openapi_responses(spec)
-        if extra:
-            kwargs["responses"] = extra
-        if spec.summary is not None:
-            kwargs["summary"] = spec.summary
-        if spec.description is not None:
-            kwargs["description"] = spec.description
-        if spec.tags is not None:
-            kwargs["tags"] = spec.tags
-        app.post(spec.path, **kwargs)(handler)
+        app.post(spec.path, **self._route_kwargs(spec))(handler)
 
     def _register_put(self, app: FastAPI, spec: EndpointSpec) -> None:
         assert spec.output_annotation is not None
-        input_model = spec.input_model
-        output_annotation = spec.output_annotation
-        list_count = spec.list_count
-        seed_from = spec.seed_from
-        error_rate = spec.error_rate
-        error_codes = spec.error_codes
-        latency_ms = spec.latency_ms
-        jitter_ms = spec.jitter_ms
-        filter_by = spec.filter_by
+        plan = _build_handler_plan(spec)
+        input_model = plan.input_model
+        output_annotation = plan.output_annotation
         store = self._store
-        path = spec.path
 
         async def handler(
             request: Request,
             body: input_model,
         ) -> output_annotation:
-            self._check_rate_limit(spec)
+            if plan.rate_limited:
+                self._check_rate_limit(spec)
             merged = self._merge_path_params(
-                input_model, body, dict(request.path_params)
+                plan.input_model, body, request.path_params
+            )
+            seed = self._resolve_seed(plan.seed_from, merged, plan.seed_getter)
+            if plan.error_rate > 0:
+                self._maybe_raise_error(plan.error_rate, plan.error_codes, seed)
+            if plan.simulates_latency:
+                await self._await_latency(plan.latency_ms, plan.jitter_ms)
+            count = plan.fixed_list_count or self._resolve_list_count(
+                plan.list_count, merged, plan.list_count_getter
             )
-            seed = self._resolve_seed(seed_from, merged)
-            self._maybe_raise_error(error_rate, error_codes, seed)
-            await self._await_latency(latency_ms, jitter_ms)
-            count = self._resolve_list_count(list_count, merged)
             response: BaseModel | list[BaseModel] = build_response(
-                output_annotation,
-                input_model,
+                plan.output_annotation,
+                plan.input_model,
                 merged,
                 list_count=count,
                 seed=seed,
-                filter_by=filter_by,
+                filter_by=plan.filter_by,
                 request=request,
             )
-            if store is not None:
-                path_param_names = _parse_path_params(path)
-                if path_param_names:
-                    path_params = dict(request.path_params)
-                    collection_path = _collection_path(path)
-                    id_field = path_param_names[0]
-                    id_value = path_params.get(id_field)
-                    if id_value is not None:
-                        if not isinstance(response, BaseModel):
-                            raise TypeError("PUT response must be a single model")
-                        resp: BaseModel = response
-                        if (
-                            "id" in type(resp).model_fields
-                            or id_field in type(resp).model_fields
-                        ):
-                            data = resp.model_dump()
-                            data[id_field] = id_value
-                            resp = type(resp).model_validate(data)
-                        existing = store.get_by_id(collection_path, id_value, id_field)
-                        if existing is not None:
-                            resp = (
-                                store.update(
-                                    collection_path,
-                                    id_value,
-                                    resp,
-                                    id_field,
-                                )
-                                or resp
-                            )
-                        else:
-                            resp = store.add(collection_path, resp)
-                        response = resp
+            id_field = plan.id_field
+            if store is not None and id_field is not None:
+                id_value = request.path_params.get(id_field)
+                if id_value is not None:
+                    if not isinstance(response, BaseModel):
+                        raise TypeError("PUT response must be a single model")
+                    resp: BaseModel = response
+                    if (
+                        "id" in type(resp).model_fields
+                        or id_field in type(resp).model_fields
+                    ):
+                        data = resp.model_dump()
+                        data[id_field] = id_value
+                        resp = type(resp).model_validate(data)
+                    collection_path = plan.collection_path
+                    existing = store.get_by_id(collection_path, id_value, id_field)
+                    if existing is not None:
+                        resp = (
+                            store.update(collection_path, id_value, resp, id_field)
+                            or resp
+                        )
+                    else:
+                        resp = store.add(collection_path, resp)
+                    response = resp
             if self._validate_responses:
-                validate_response(output_annotation, response)
-            return response
+                validate_response(plan.output_annotation, response)
+            return _render(plan, response)
 
-        kwargs: dict[str, Any] = {"response_model": output_annotation}
-        extra = self._openapi_responses(spec)
-        if extra:
-            kwargs["responses"] = extra
-        if spec.summary is not None:
-            kwargs["summary"] = spec.summary
-        if spec.description is not None:
-            kwargs["description"] = spec.description
-        if spec.tags is not None:
-            kwargs["tags"] = spec.tags
-        app.put(spec.path, **kwargs)(handler)
+        app.put(spec.path, **self._route_kwargs(spec))(handler)
 
     def _register_patch(self, app: FastAPI, spec: EndpointSpec) -> None:
         assert spec.output_annotation is not None
-        input_model = spec.input_model
-        output_annotation = spec.output_annotation
-        list_count = spec.list_count
-        seed_from = spec.seed_from
-        error_rate = spec.error_rate
-        error_codes = spec.error_codes
-        latency_ms = spec.latency_ms
-        jitter_ms = spec.jitter_ms
-        filter_by = spec.filter_by
+        plan = _build_handler_plan(spec)
+        input_model = plan.input_model
+        output_annotation = plan.output_annotation
         store = self._store
-        path = spec.path
 
         async def handler(
             request: Request,
             body: input_model,
         ) -> output_annotation:
-            self._check_rate_limit(spec)
+            if plan.rate_limited:
+                self._check_rate_limit(spec)
             merged = self._merge_path_params(
-                input_model, body, dict(request.path_params)
+                plan.input_model, body, request.path_params
+            )
+            seed = self._resolve_seed(plan.seed_from, merged, plan.seed_getter)
+            if plan.error_rate > 0:
+                self._maybe_raise_error(plan.error_rate, plan.error_codes, seed)
+            if plan.simulates_latency:
+                await self._await_latency(plan.latency_ms, plan.jitter_ms)
+            # Resolve the store key once; 404 before any response is generated.
+            id_field = plan.id_field
+            id_value = None
+            if store is not None and id_field is not None:
+                id_value = request.path_params.get(id_field)
+                if (
+                    id_value is not None
+                    and store.get_by_id(plan.collection_path, id_value, id_field)
+                    is None
+                ):
+                    raise self._not_found(plan.collection_path, id_field, id_value)
+            count = plan.fixed_list_count or self._resolve_list_count(
+                plan.list_count, merged, plan.list_count_getter
             )
-            seed = self._resolve_seed(seed_from, merged)
-            self._maybe_raise_error(error_rate, error_codes, seed)
-            await self._await_latency(latency_ms, jitter_ms)
-            if store is not None:
-                path_param_names = _parse_path_params(path)
-                if path_param_names:
-                    path_params = dict(request.path_params)
-                    collection_path = _collection_path(path)
-                    id_field = path_param_names[0]
-                    id_value = path_params.get(id_field)
-                    if id_value is not None:
-                        existing = store.get_by_id(collection_path, id_value, id_field)
-                        if existing is None:
-                            detail_patch: str | dict[str, Any] = "Not found"
-                            if self._verbose_errors:
-                                detail_patch = {
-                                    "detail": "Not found",
-                                    "collection": collection_path,
-                                    "id_field": id_field,
-                                    "id_value": id_value,
-                                }
-                            raise HTTPException(status_code=404, detail=detail_patch)
-            count = self._resolve_list_count(list_count, merged)
             response: BaseModel | list[BaseModel] = build_response(
-                output_annotation,
-                input_model,
+                plan.output_annotation,
+                plan.input_model,
                 merged,
                 list_count=count,
                 seed=seed,
-                filter_by=filter_by,
+                filter_by=plan.filter_by,
                 request=request,
             )
-            if store is not None:
-                path_param_names = _parse_path_params(path)
-                if path_param_names:
-                    path_params = dict(request.path_params)
-                    collection_path = _collection_path(path)
-                    id_field = path_param_names[0]
-                    id_value = path_params.get(id_field)
-                    if id_value is not None:
-                        if not isinstance(response, BaseModel):
-                            raise TypeError("PATCH response must be a single model")
-                        resp: BaseModel = response
-                        if id_field in type(resp).model_fields:
-                            data = resp.model_dump()
-                            data[id_field] = id_value
-                            resp = type(resp).model_validate(data)
-                        updated = store.update(
-                            collection_path,
-                            id_value,
-                            resp,
-                            id_field,
-                        )
-                        if updated is not None:
-                            response = updated
-                        else:
-                            response = resp
+            if store is not None and id_field is not None and id_value is not None:
+                if not isinstance(response, BaseModel):
+                    raise TypeError("PATCH response must be a single model")
+                resp: BaseModel = response
+                if id_field in type(resp).model_fields:
+                    data = resp.model_dump()
+                    data[id_field] = id_value
+                    resp = type(resp).model_validate(data)
+                updated = store.update(plan.collection_path, id_value, resp, id_field)
+                response = updated if updated is not None else resp
             if self._validate_responses:
-                validate_response(output_annotation, response)
-            return response
+                validate_response(plan.output_annotation, response)
+            return _render(plan, response)
 
-        kwargs: dict[str, Any] = {"response_model": output_annotation}
-        extra = self._openapi_responses(spec)
-        if extra:
-            kwargs["responses"] = extra
-        if spec.summary is not None:
-            kwargs["summary"] = spec.summary
-        if spec.description is not None:
-            kwargs["description"] = spec.description
-        if spec.tags is not None:
-            kwargs["tags"] = spec.tags
-        app.patch(spec.path, **kwargs)(handler)
+        app.patch(spec.path, **self._route_kwargs(spec))(handler)
 
     def _register_delete(self, app: FastAPI, spec: EndpointSpec) -> None:
-        input_model = spec.input_model
-        output_annotation = spec.output_annotation
-        seed_from = spec.seed_from
-        error_rate = spec.error_rate
-        error_codes = spec.error_codes
-        latency_ms = spec.latency_ms
-        jitter_ms = spec.jitter_ms
+        plan = _build_handler_plan(spec)
+        input_model = plan.input_model
         store = self._store
-        path = spec.path
 
         async def handler(
             request: Request,
             body: input_model | None = Body(None),
         ) -> Any:
-            self._check_rate_limit(spec)
-            path_params = dict(request.path_params)
+            if plan.rate_limited:
+                self._check_rate_limit(spec)
+            path_params = request.path_params
             data: dict[str, Any] = body.model_dump() if body is not None else {}
-            merged = input_model.model_validate({**data, **path_params})
-            seed = self._resolve_seed(seed_from, merged)
-            self._maybe_raise_error(error_rate, error_codes, seed)
-            await self._await_latency(latency_ms, jitter_ms)
-            if store is not None:
-                path_param_names = _parse_path_params(path)
-                if path_param_names:
-                    id_field = path_param_names[0]
-                    id_value = path_params.get(id_field)
-                    if id_value is not None:
-                        collection_path = _collection_path(path)
-                        if not store.remove(collection_path, id_value, id_field):
-                            detail_del: str | dict[str, Any] = "Not found"
-                            if self._verbose_errors:
-                                detail_del = {
-                                    "detail": "Not found",
-                                    "collection": collection_path,
-                                    "id_field": id_field,
-                                    "id_value": id_value,
-                                }
-                            raise HTTPException(status_code=404, detail=detail_del)
-                        return Response(status_code=204)
-            if output_annotation is None:
+            merged = plan.input_model.model_validate({**data, **path_params})
+            seed = self._resolve_seed(plan.seed_from, merged, plan.seed_getter)
+            if plan.error_rate > 0:
+                self._maybe_raise_error(plan.error_rate, plan.error_codes, seed)
+            if plan.simulates_latency:
+                await self._await_latency(plan.latency_ms, plan.jitter_ms)
+            id_field = plan.id_field
+            if store is not None and id_field is not None:
+                id_value = path_params.get(id_field)
+                if id_value is not None:
+                    if not store.remove(plan.collection_path, id_value, id_field):
+                        raise self._not_found(plan.collection_path, id_field, id_value)
+                    return Response(status_code=204)
+            # output=None is the default: no body is generated or validated.
+            if plan.output_annotation is None:
                 return Response(status_code=204)
             response: BaseModel | list[BaseModel] = build_response(
-                output_annotation,
-                input_model,
+                plan.output_annotation,
+                plan.input_model,
                 merged,
                 list_count=1,
                 seed=seed,
@@ -920,12 +1014,16 @@ class SemblanceAPI:
                 request=request,
             )
             if self._validate_responses:
-                validate_response(output_annotation, response)
-            return response
+                validate_response(plan.output_annotation, response)
+            return _render(plan, response)
+
+        app.delete(spec.path, **self._route_kwargs(spec))(handler)
 
+    def _route_kwargs(self, spec: EndpointSpec) -> dict[str, Any]:
+        """FastAPI route options: response model, OpenAPI responses, and docs."""
         kwargs: dict[str, Any] = {}
-        if output_annotation is not None:
-            kwargs["response_model"] = output_annotation
+        if spec.output_annotation is not None:
+            kwargs["response_model"] = spec.output_annotation
         extra = self._openapi_responses(spec)
         if extra:
             kwargs["responses"] = extra
@@ -935,4 +1033,4 @@ class SemblanceAPI:
             kwargs["description"] = spec.description
         if spec.tags is not None:
             kwargs["tags"] = spec.tags
-        app.delete(spec.path, **kwargs)(handler)
+        return kwargs
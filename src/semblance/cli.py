@@ -9,14 +9,15 @@ import argparse
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 
-def _resolve_app_path(path: str) -> str:
-    """If path contains ':', return as-is. Else infer module:attr (single SemblanceAPI or FastAPI in module)."""
-    if ":" in path:
-        return path
-    module_path = path
+def _import_module(module_path: str) -> ModuleType:
+    """Return the module at module_path, importing it (lazily) only if not yet loaded."""
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return module
     spec = importlib.util.find_spec(module_path)
     if spec is None or spec.origin is None:
         raise SystemExit(f"Module {module_path!r} not found")
@@ -29,6 +30,15 @@ def _resolve_app_path(path: str) -> str:
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_path] = module
     spec.loader.exec_module(module)
+    return module
+
+
+def _resolve_app_path(path: str) -> str:
+    """If path contains ':', return as-is. Else infer module:attr (single SemblanceAPI or FastAPI in module)."""
+    if ":" in path:
+        return path
+    module_path = path
+    module = _import_module(module_path)
     try:
         from fastapi import FastAPI as _FastAPI  # noqa: N806
     except ImportError:
@@ -63,18 +73,7 @@ def _load_target(path: str) -> Any:
     module_path, attr = resolved.split(":", 1)
     if not module_path or not attr:
         raise SystemExit("module:attr must both be non-empty")
-    spec = importlib.util.find_spec(module_path)
-    if spec is None or spec.origin is None:
-        raise SystemExit(f"Module {module_path!r} not found")
-    if spec.loader is None:
-        raise SystemExit(
-            f"Module {module_path!r} cannot be loaded (e.g. namespace package)"
-        )
-    loader = importlib.util.LazyLoader(spec.loader)
-    spec.loader = loader
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_path] = module
-    spec.loader.exec_module(module)
+    module = _import_module(module_path)
     if not hasattr(module, attr):
         raise SystemExit(f"Attribute {attr!r} not found in module {module_path!r}")
     return getattr(module, attr)
@@ -284,17 +283,7 @@ def main() -> None:
     init_parser.set_defaults(func=cmd_init)
 
     args = parser.parse_args()
-    if args.command == "run":
-        cmd_run(args)
-    elif args.command == "init":
-        cmd_init(args)
-    elif args.command == "export":
-        if args.export_type == "openapi":
-            cmd_export_openapi(args)
-        elif args.export_type == "fixtures":
-            cmd_export_fixtures(args)
-    elif args.command == "validate":
-        cmd_validate(args)
+    args.func(args)
 
 
 if __name__ == "__main__":
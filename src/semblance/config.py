@@ -7,10 +7,19 @@ Used when constructing SemblanceAPI with config_path= or from_config().
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
+try:
+    import tomllib as _toml  # type: ignore[import-not-found]
+except ImportError:  # Python 3.10
+    try:
+        import tomli as _toml  # type: ignore[no-redef,import-not-found]
+    except ImportError:  # pragma: no cover - optional dependency
+        _toml = None  # type: ignore[assignment]
+
 
 @dataclass
 class SemblanceConfig:
@@ -29,6 +38,8 @@ _DEFAULT = SemblanceConfig()
 
 def _load_toml_section(path: Path) -> dict | None:
     """Load [tool.semblance] from a TOML file. Returns None if not found or on error."""
+    if _toml is None:  # no TOML parser available (Python 3.10 without tomli)
+        return None
     try:
         with open(path, "rb") as f:
             data = _toml_load(f)
@@ -42,14 +53,7 @@ def _load_toml_section(path: Path) -> dict | None:
 
 def _toml_load(f: object) -> dict[str, object]:
     """Load TOML; use tomllib (3.11+) or tomli."""
-    try:
-        import tomllib  # type: ignore[import-not-found]
-
-        return cast(dict[str, object], tomllib.load(f))
-    except ImportError:
-        import tomli
-
-        return cast(dict[str, object], tomli.load(f))  # type: ignore[arg-type]
+    return cast(dict[str, object], _toml.load(f))  # type: ignore[arg-type]
 
 
 def _load_yaml(path: Path) -> dict | None:
@@ -69,7 +73,7 @@ def _load_yaml(path: Path) -> dict | None:
 def _merge_config(config_dict: dict | None) -> SemblanceConfig:
     """Build SemblanceConfig from a dict; missing keys use defaults."""
     if not config_dict:
-        return _DEFAULT
+        return SemblanceConfig()
     seed = config_dict.get("seed")
     return SemblanceConfig(
         seed=seed if seed is not None else _DEFAULT.seed,
@@ -89,24 +93,55 @@ def load_config(config_path: str | Path | None = None) -> SemblanceConfig:
 
     If config_path is given, load from that file (.yaml/.yml or .toml).
     If config_path is None, look for semblance.yaml or pyproject.toml in the
-    current working directory and one level up.
+    current working directory and one level up. The discovery result is cached
+    per working directory and candidate files (path and modification time),
+    so edits to those files are picked up.
 
-    Returns SemblanceConfig with defaults for any missing keys.
+    Returns a new SemblanceConfig with defaults for any missing keys.
     """
     if config_path is not None:
         path = Path(config_path)
         if not path.exists():
-            return _DEFAULT
+            return SemblanceConfig()
         if path.suffix in (".yaml", ".yml"):
             data = _load_yaml(path)
             return _merge_config(data)
         if path.suffix == ".toml" or path.name == "pyproject.toml":
             data = _load_toml_section(path)
             return _merge_config(data)
-        return _DEFAULT
+        return SemblanceConfig()
+
+    cwd = Path.cwd()
+    # Callers get their own copy; the cached instance is never handed out.
+    return replace(_discover_config(str(cwd), _discovery_key(cwd)))
 
-    # Discovery: cwd and parent
-    for directory in (Path.cwd(), Path.cwd().parent):
+
+_CONFIG_NAMES = ("semblance.yaml", "semblance.yml", "pyproject.toml")
+
+
+def _discovery_key(base: Path) -> tuple[tuple[str, int], ...]:
+    """(path, mtime_ns) of every existing config candidate in base and its parent."""
+    key: list[tuple[str, int]] = []
+    for directory in (base, base.parent):
+        for name in _CONFIG_NAMES:
+            path = directory / name
+            try:
+                key.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                continue
+    return tuple(key)
+
+
+@lru_cache(maxsize=16)
+def _discover_config(cwd: str, key: tuple[tuple[str, int], ...]) -> SemblanceConfig:
+    """
+    Look for semblance.yaml/.yml or pyproject.toml in cwd and its parent.
+
+    Cached per cwd and key (see _discovery_key): adding, removing or editing
+    a candidate file changes the key and triggers a fresh walk.
+    """
+    base = Path(cwd)
+    for directory in (base, base.parent):
         yaml_path = directory / "semblance.yaml"
         if yaml_path.exists():
             data = _load_yaml(yaml_path)
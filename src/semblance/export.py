@@ -5,65 +5,320 @@ Export OpenAPI schema (optionally with response examples from live calls) and
 JSON fixtures per endpoint for MSW, fixtures, or OpenAPI-driven tooling.
 """
 
+import asyncio
 import json
+import os
 import re
+from collections.abc import AsyncIterator, Coroutine, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar
 
+import httpx
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 # JSON-serializable value from API response (dict, list, or scalar).
 JSONResponse = dict[str, object] | list[object] | object
 
+# Methods Starlette adds implicitly; not exported as routes.
+_SKIP_METHODS: frozenset[str] = frozenset({"HEAD", "OPTIONS"})
+
+_PATH_PARAM_RE = re.compile(r"\{\w+\}")
+
+# '/users/{id}' -> 'users_id' in one pass (see _route_id).
+_ROUTE_ID_TABLE = str.maketrans({"/": "_", "{": None, "}": None})
+
+
+@lru_cache(maxsize=512)
+def _route_id(path: str) -> str:
+    """Fixture-friendly id for a path template, e.g. '/users/{id}' -> 'users_id'."""
+    return path.strip("/").translate(_ROUTE_ID_TABLE) or "root"
+
 
 def _get_routes(app: FastAPI) -> list[tuple[str, str, str]]:
     """Return (path, method, route_id) for each API route."""
     routes: list[tuple[str, str, str]] = []
     for route in app.routes:
         if hasattr(route, "path") and hasattr(route, "methods"):
-            for method in route.methods - {"HEAD", "OPTIONS"}:
-                route_id = (
-                    route.path.strip("/")
-                    .replace("/", "_")
-                    .replace("{", "")
-                    .replace("}", "")
-                    or "root"
-                )
+            route_id = _route_id(route.path)
+            for method in route.methods:
+                if method in _SKIP_METHODS:
+                    continue
                 routes.append((route.path, method, f"{route_id}_{method}"))
     return routes
 
 
+def _dumps_json(obj: object) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles them
+    return json.dumps(obj, indent=2).encode()
+
+
+@lru_cache(maxsize=512)
 def _fill_path_params(path: str) -> str:
-    """Replace path params with sample values."""
-    return re.sub(r"\{\w+\}", "1", path)
+    """Replace path params with sample values (cached per path template)."""
+    return _PATH_PARAM_RE.sub("1", path)
+
+
+# Upper bound on in-flight sample requests during export.
+_MAX_CONCURRENT_SAMPLES = 32
+
+_SAMPLE_METHODS = ("get", "post", "put", "patch", "delete")
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Upper bound on threads used to write export files.
+_MAX_WRITE_WORKERS = 32
 
+_T = TypeVar("_T")
 
-def _sample_request(client: TestClient, path: str, method: str) -> JSONResponse | None:
+
+async def _sample_request(
+    client: httpx.AsyncClient, path: str, method: str
+) -> JSONResponse | None:
     """Make a minimal request to the endpoint and return the JSON response."""
+    if method.lower() not in _SAMPLE_METHODS:
+        return None
     url = _fill_path_params(path)
-    if method == "GET":
-        r = client.get(url)
-    elif method == "POST":
-        r = client.post(url, json={})
-    elif method == "PUT":
-        r = client.put(url, json={})
-    elif method == "PATCH":
-        r = client.patch(url, json={})
-    elif method == "DELETE":
-        r = client.delete(url)
+    if method in _BODY_METHODS:
+        r = await client.request(method, url, json={})
     else:
-        return None
+        r = await client.request(method, url)
     if r.status_code in (200, 201):
         try:
-            return cast(JSONResponse, r.json())
+            sample: JSONResponse = r.json()
+            return sample
         except Exception:
             return None
-    if r.status_code == 204:
-        return None
     return None
 
 
+def _sample_targets(schema: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return (path, METHOD) for every sampleable operation in the schema."""
+    return [
+        (path, method.upper())
+        for path, methods in schema.get("paths", {}).items()
+        for method in _SAMPLE_METHODS
+        if method in methods
+    ]
+
+
+def _example_targets(
+    schema: dict[str, Any],
+) -> list[tuple[dict[str, Any], str, str, str | None]]:
+    """
+    Return (op, path, METHOD, success_code) for every sampleable operation.
+
+    success_code is the documented "200"/"201" response that receives the
+    example, or None when neither exists yet. Ensures op["responses"] exists.
+    """
+    targets: list[tuple[dict[str, Any], str, str, str | None]] = []
+    for path, methods in schema.get("paths", {}).items():
+        for method in _SAMPLE_METHODS:
+            op = methods.get(method)
+            if op is None:
+                continue
+            responses = op.setdefault("responses", {})
+            code = (
+                "200" if "200" in responses else "201" if "201" in responses else None
+            )
+            targets.append((op, path, method.upper(), code))
+    return targets
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[dict[str, Any]]:
+    """
+    Drive the app's ASGI lifespan protocol and yield its lifespan state.
+
+    This is what a server (or TestClient) does: state yielded by the app's
+    lifespan is collected here and must be copied into each request scope.
+    """
+    state: dict[str, Any] = {}
+    to_app: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    from_app: asyncio.Queue[MutableMapping[str, Any]] = asyncio.Queue()
+    scope = {
+        "type": "lifespan",
+        "asgi": {"version": "3.0", "spec_version": "2.0"},
+        "state": state,
+    }
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        await from_app.put(message)
+
+    task = asyncio.ensure_future(app(scope, to_app.get, send))
+
+    async def reply(message_type: str) -> MutableMapping[str, Any]:
+        await to_app.put({"type": message_type})
+        getter = asyncio.ensure_future(from_app.get())
+        done, _ = await asyncio.wait({getter, task}, return_when="FIRST_COMPLETED")
+        if getter in done:
+            return getter.result()
+        getter.cancel()
+        task.result()  # re-raises the app's error, if any
+        raise RuntimeError(f"App exited during {message_type}")
+
+    message = await reply("lifespan.startup")
+    if message["type"] == "lifespan.startup.failed":
+        (error,) = await asyncio.gather(task, return_exceptions=True)
+        if isinstance(error, Exception):
+            raise error  # the exception raised by the app's startup
+        raise RuntimeError(message.get("message") or "Lifespan startup failed")
+    try:
+        yield state
+    finally:
+        await reply("lifespan.shutdown")
+        await task
+
+
+async def _sample_all(
+    app: FastAPI, targets: list[tuple[str, str]]
+) -> dict[tuple[str, str], JSONResponse | None]:
+    """
+    Sample every (path, METHOD) target against the app.
+
+    Runs the app lifespan once and gives each request a copy of its state.
+    Requests run in target order: consecutive GETs are sampled concurrently
+    (bounded by a semaphore), while every other method runs alone, so what a
+    POST/PUT/PATCH/DELETE changes is seen exactly as in a serial run.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SAMPLES)
+    results: dict[tuple[str, str], JSONResponse | None] = {}
+
+    async with _lifespan(app) as state:
+
+        async def app_with_state(scope: Any, receive: Any, send: Any) -> None:
+            if scope["type"] in ("http", "websocket"):
+                scope = {**scope, "state": dict(state)}
+            await app(scope, receive, send)
+
+        transport = httpx.ASGITransport(app=app_with_state)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+
+            async def sample(path: str, method: str) -> JSONResponse | None:
+                async with semaphore:
+                    return await _sample_request(client, path, method)
+
+            batch: list[tuple[str, str]] = []
+
+            async def flush() -> None:
+                samples = await asyncio.gather(*(sample(p, m) for p, m in batch))
+                results.update(zip(batch, samples))
+                batch.clear()
+
+            for target in targets:
+                if target[1] == "GET":
+                    batch.append(target)
+                    continue
+                await flush()
+                results[target] = await sample(*target)
+            await flush()
+    return {target: results[target] for target in targets}
+
+
+def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run a coroutine to completion, even if called from a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _apply_examples(
+    targets: list[tuple[dict[str, Any], str, str, str | None]],
+    samples: dict[tuple[str, str], JSONResponse | None],
+) -> None:
+    """Attach sampled responses to their operations as OpenAPI examples."""
+    for op, path, method, code in targets:
+        sample = samples[path, method]
+        responses = op["responses"]
+        if sample is None:
+            if method == "DELETE" and "204" not in responses:
+                responses["204"] = {"description": "No Content"}
+        elif code is None:
+            responses["200"] = {
+                "description": "Successful response",
+                "content": {"application/json": {"example": sample}},
+            }
+        else:
+            content = responses[code].setdefault("content", {})
+            content.setdefault("application/json", {})["example"] = sample
+
+
+def _fixture_files(
+    samples: dict[tuple[str, str], JSONResponse | None],
+) -> list[tuple[str, bytes]]:
+    """Return (filename, payload) for each {route_id}_{METHOD}.json fixture."""
+    files: list[tuple[str, bytes]] = []
+    for (path, method), sample in samples.items():
+        filename = f"{_route_id(path)}_{method}.json"
+        if sample is not None:
+            files.append((filename, _dumps_json(sample)))
+        elif method == "DELETE":
+            files.append((filename, _dumps_json({"status": 204})))
+    return files
+
+
+def _write_files(output_dir: Path, files: list[tuple[str, bytes]]) -> None:
+    """Write files concurrently; file I/O releases the GIL."""
+    if len(files) <= 1:
+        for name, payload in files:
+            (output_dir / name).write_bytes(payload)
+        return
+    workers = min(_MAX_WRITE_WORKERS, (os.cpu_count() or 1) * 4, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the iterator so write errors propagate.
+        list(executor.map(lambda f: (output_dir / f[0]).write_bytes(f[1]), files))
+
+
+def _export(
+    app: FastAPI, output_dir: Path | None, include_examples: bool
+) -> dict[str, Any]:
+    """Sample the app once and feed both schema examples and fixture files."""
+    schema: dict[str, Any] = app.openapi()
+    if output_dir is None and not include_examples:
+        return schema
+
+    targets = _example_targets(schema)
+    samples = _run_sync(_sample_all(app, [(p, m) for _, p, m, _ in targets]))
+    if include_examples:
+        _apply_examples(targets, samples)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        files = _fixture_files(samples)
+        files.append(("openapi.json", _dumps_json(schema)))
+        _write_files(output_dir, files)
+    return schema
+
+
+def export_all(
+    app: FastAPI, output_path: str | Path, include_examples: bool = True
+) -> dict[str, Any]:
+    """
+    Export fixtures and the OpenAPI schema from a single round of sampling.
+
+    Equivalent to export_openapi plus export_fixtures, but runs the app
+    lifespan and calls each endpoint only once. With include_examples, the
+    written openapi.json carries the sampled response examples. Returns the
+    schema.
+    """
+    return _export(app, Path(output_path), include_examples)
+
+
 def export_openapi(app: FastAPI, include_examples: bool = False) -> dict[str, Any]:
     """
     Export OpenAPI schema for the FastAPI app.
@@ -71,32 +326,7 @@ def export_openapi(app: FastAPI, include_examples: bool = False) -> dict[str, An
     If include_examples is True, calls each endpoint with minimal input and
     populates response examples from the returned JSON.
     """
-    schema = cast(dict[str, Any], app.openapi())
-    if not include_examples:
-        return schema
-
-    with TestClient(app) as client:
-        for path, methods in schema.get("paths", {}).items():
-            for method in ("get", "post", "put", "patch", "delete"):
-                op = methods.get(method)
-                if op is None:
-                    continue
-                sample = _sample_request(client, path, method.upper())
-                if "responses" not in op:
-                    op["responses"] = {}
-                if sample is not None:
-                    if "200" not in op["responses"] and "201" not in op["responses"]:
-                        op["responses"]["200"] = {"description": "Successful response"}
-                    for code in ("200", "201"):
-                        if code in op["responses"]:
-                            content = op["responses"][code].setdefault("content", {})
-                            json_content = content.setdefault("application/json", {})
-                            json_content["example"] = sample
-                            break
-                elif method.upper() == "DELETE":
-                    if "204" not in op["responses"]:
-                        op["responses"]["204"] = {"description": "No Content"}
-    return schema
+    return _export(app, None, include_examples)
 
 
 def export_fixtures(app: FastAPI, output_path: str | Path) -> None:
@@ -106,27 +336,4 @@ def export_fixtures(app: FastAPI, output_path: str | Path) -> None:
     Calls each GET/POST endpoint with minimal input and saves the response
     to output_path/{route_id}_{METHOD}.json. Also writes openapi.json.
     """
-    output_dir = Path(output_path)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    schema = cast(dict[str, Any], app.openapi())
-    with TestClient(app) as client:
-        for path, methods in schema.get("paths", {}).items():
-            for method in ("get", "post", "put", "patch", "delete"):
-                op = methods.get(method)
-                if op is None:
-                    continue
-                sample = _sample_request(client, path, method.upper())
-                route_id = (
-                    path.strip("/").replace("/", "_").replace("{", "").replace("}", "")
-                    or "root"
-                )
-                filename = f"{route_id}_{method.upper()}.json"
-                if sample is not None:
-                    (output_dir / filename).write_text(json.dumps(sample, indent=2))
-                elif method.upper() == "DELETE":
-                    (output_dir / filename).write_text(
-                        json.dumps({"status": 204}, indent=2)
-                    )
-
-    (output_dir / "openapi.json").write_text(json.dumps(schema, indent=2))
+    _export(app, Path(output_path), include_examples=False)
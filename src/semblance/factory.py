@@ -6,47 +6,178 @@ resolver. Supports single model, list[model], and PaginatedResponse[model]
 outputs. Handles nested models, ComputedFrom, filter_by, and determinism via seed.
 """
 
-from typing import Any, cast, get_origin
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from types import FunctionType, MethodType
+from typing import Any, NamedTuple, cast, get_origin
 
 from polyfactory.factories.pydantic_factory import ModelFactory
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from starlette.requests import Request
 
 from semblance.pagination import PaginatedResponse
-from semblance.resolver import get_output_model_for_type, resolve_overrides
+from semblance.resolver import (
+    _ComputedSpec,
+    _NestedSpec,
+    get_output_model_for_type,
+    resolve_overrides,
+)
+
+
+@lru_cache(maxsize=256)
+def _factory_for(model: type[BaseModel]) -> type[ModelFactory[Any]]:
+    """Return the (cached) Polyfactory factory class for model."""
+    return cast(type[ModelFactory[Any]], ModelFactory.create_factory(model))
+
+
+@lru_cache(maxsize=256)
+def _builder_for(model: type[BaseModel]) -> Callable[[dict[str, Any]], BaseModel]:
+    """
+    Return a build function specialized for model.
+
+    When the resolved overrides already supply every field, the model is
+    instantiated directly and Polyfactory's per-field generation pass is
+    skipped. Otherwise (or for models with aliased fields, where Polyfactory
+    maps names itself) the cached factory builds the instance.
+    """
+    factory_class = _factory_for(model)
+    fields = model.model_fields
+    if not fields or any(
+        f.alias is not None or f.validation_alias is not None for f in fields.values()
+    ):
+        return lambda resolved: cast(BaseModel, factory_class.build(**resolved))
+    names = frozenset(fields)
+
+    def build(resolved: dict[str, Any]) -> BaseModel:
+        if names.issubset(resolved):
+            return model(**resolved)
+        return cast(BaseModel, factory_class.build(**resolved))
+
+    return build
+
+
+# Override kinds, dispatched on type(value) by _override_kind.
+_VALUE, _CALL, _NESTED, _COMPUTED = range(4)
+
+_OVERRIDE_KINDS: dict[type, int] = {
+    _NestedSpec: _NESTED,
+    _ComputedSpec: _COMPUTED,
+    FunctionType: _CALL,
+    MethodType: _CALL,
+    str: _VALUE,
+    int: _VALUE,
+    float: _VALUE,
+    bool: _VALUE,
+}
+
+
+def _override_kind(value: Any) -> int:
+    """Classify an override value with one lookup on its type."""
+    cls = type(value)
+    kind = _OVERRIDE_KINDS.get(cls)
+    if kind is None:
+        # Callability is a property of the type, so the answer can be cached.
+        kind = _CALL if callable(value) and not isinstance(value, type) else _VALUE
+        _OVERRIDE_KINDS[cls] = kind
+    return kind
+
+
+def _needs_evaluation(value: Any) -> bool:
+    """True if an override value must be re-evaluated for every build."""
+    return _override_kind(value) != _VALUE
+
+
+class _Frame(NamedTuple):
+    """One nested model being resolved by _evaluate_overrides."""
+
+    items: Iterator[tuple[str, Any]]
+    result: dict[str, Any]
+    computed: dict[str, _ComputedSpec]
+    model: type[BaseModel] | None
+    parent: dict[str, Any] | None
+    key: str
 
 
 def _evaluate_overrides(
     overrides: dict[str, Any],
     seed: int | None = None,
+    static: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Replace callables and nested specs in overrides with their resolved values."""
-    result: dict[str, Any] = {}
-    computed: dict[str, tuple[tuple[str, ...], Any]] = {}
+    """
+    Replace callables and nested specs in overrides with their resolved values.
+
+    static holds already-resolved values that are copied into the result (and
+    are visible to computed fields). Nested models are resolved with an explicit
+    stack rather than recursion: a nested spec pushes a frame, and when its
+    overrides are exhausted the model is built into the parent's result.
+    """
+    root: dict[str, Any] = dict(static) if static else {}
+    stack = [_Frame(iter(overrides.items()), root, {}, None, None, "")]
+    while stack:
+        frame = stack[-1]
+        result = frame.result
+        for key, value in frame.items:
+            kind = _override_kind(value)
+            if kind == _VALUE:
+                result[key] = value
+            elif kind == _CALL:
+                result[key] = value()
+            elif kind == _COMPUTED:
+                frame.computed[key] = value
+            else:
+                stack.append(
+                    _Frame(
+                        iter(value.overrides.items()), {}, {}, value.model, result, key
+                    )
+                )
+                break
+        else:
+            stack.pop()
+            for key, spec in frame.computed.items():
+                values = spec.getter(result)
+                result[key] = (
+                    spec.fn(values) if len(spec.fields) == 1 else spec.fn(*values)
+                )
+            if frame.model is not None and frame.parent is not None:
+                if seed is not None:
+                    _factory_for(frame.model).seed_random(seed)
+                frame.parent[frame.key] = _builder_for(frame.model)(result)
+
+    return root
 
+
+def _override_evaluator(
+    overrides: dict[str, Any],
+    seed: int | None = None,
+) -> Callable[[], dict[str, Any]]:
+    """
+    Return a function producing resolved overrides for one build.
+
+    Plain values are resolved once; only callables, nested and computed
+    entries are re-evaluated per call. When every dynamic entry is a plain
+    callable (e.g. DateRangeFrom), each call is a flat loop over them,
+    invoked in field order, without _evaluate_overrides' stack machinery.
+    """
+    static: dict[str, Any] = {}
+    dynamic: dict[str, Any] = {}
     for key, value in overrides.items():
-        if isinstance(value, dict) and "_computed" in value and "_fn" in value:
-            computed[key] = (value["_computed"], value["_fn"])
-        elif isinstance(value, dict) and "_nested" in value and "_overrides" in value:
-            nested_model = value["_nested"]
-            nested_overrides = value["_overrides"]
-            nested_resolved = _evaluate_overrides(nested_overrides, seed=seed)
-            factory_class: type[ModelFactory[Any]] = ModelFactory.create_factory(
-                nested_model
-            )
-            if seed is not None:
-                factory_class.seed_random(seed)
-            result[key] = factory_class.build(**nested_resolved)
-        elif callable(value) and not isinstance(value, type):
-            result[key] = value()
+        if _needs_evaluation(value):
+            dynamic[key] = value
         else:
-            result[key] = value
+            static[key] = value
+    if not dynamic:
+        return lambda: static
+    if all(_override_kind(v) == _CALL for v in dynamic.values()):
+        calls = tuple(dynamic.items())
 
-    for key, (dep_fields, fn) in computed.items():
-        dep_values = [result[f] for f in dep_fields]
-        result[key] = fn(*dep_values)
+        def evaluate_calls() -> dict[str, Any]:
+            result = dict(static)
+            for key, fn in calls:
+                result[key] = fn()
+            return result
 
-    return result
+        return evaluate_calls
+    return lambda: _evaluate_overrides(dynamic, seed=seed, static=static)
 
 
 def build_one(
@@ -61,10 +192,9 @@ def build_one(
         output_model, input_model, input_instance, seed=seed, request=request
     )
     resolved = _evaluate_overrides(overrides, seed=seed)
-    factory_class = ModelFactory.create_factory(output_model)
     if seed is not None:
-        factory_class.seed_random(seed)
-    return cast(BaseModel, factory_class.build(**resolved))
+        _factory_for(output_model).seed_random(seed)
+    return _builder_for(output_model)(resolved)
 
 
 def build_list(
@@ -80,33 +210,45 @@ def build_list(
     overrides = resolve_overrides(
         output_model, input_model, input_instance, seed=seed, request=request
     )
-    factory_class = ModelFactory.create_factory(output_model)
+    target_val: Any = None
+    if filter_by:
+        target_val = getattr(input_instance, filter_by, None)
+        if filter_by not in overrides:
+            # Force the field to the input value instead of rejection sampling.
+            overrides = {**overrides, filter_by: target_val}
     if seed is not None:
-        factory_class.seed_random(seed)
+        _factory_for(output_model).seed_random(seed)
+    build = _builder_for(output_model)
+    evaluate = _override_evaluator(overrides, seed=seed)
 
-    if filter_by:
-        target_val = input_instance.model_dump().get(filter_by)
-        oversample = count * 5
-        result: list[BaseModel] = []
-        for _ in range(oversample):
-            resolved = _evaluate_overrides(overrides, seed=seed)
-            item = factory_class.build(**resolved)
-            item_val = getattr(item, filter_by, None)
-            if item_val == target_val:
-                result.append(item)
-                if len(result) >= count:
-                    break
-        return result[:count]
-
-    result = []
-    for _ in range(count):
-        resolved = _evaluate_overrides(overrides, seed=seed)
-        result.append(factory_class.build(**resolved))
-    return result
+    if not filter_by or count <= 0:
+        return [build(evaluate()) for _ in range(count)]
+
+    if _needs_evaluation(overrides[filter_by]):
+        # A per-item link owns the field; keep only the items that match.
+        items = [build(evaluate()) for _ in range(count)]
+        return [i for i in items if getattr(i, filter_by, None) == target_val]
+
+    # filter_by is pinned to one value: every item matches or none does.
+    try:
+        first = build(evaluate())
+    except ValidationError:
+        return []  # the input value is not valid for the output field
+    if getattr(first, filter_by, None) != target_val:
+        return []
+    return [first, *(build(evaluate()) for _ in range(count - 1))]
 
 
 def _get_paginated_inner(annotation: type) -> type[BaseModel] | None:
     """Extract inner model from PaginatedResponse[Model]."""
+    try:
+        return _cached_paginated_inner(annotation)
+    except TypeError:  # unhashable annotation: never a PaginatedResponse
+        return None
+
+
+@lru_cache(maxsize=256)
+def _cached_paginated_inner(annotation: type) -> type[BaseModel] | None:
     try:
         if not issubclass(annotation, PaginatedResponse):
             return None
@@ -146,29 +288,33 @@ def build_response(
     # PaginatedResponse[Model]
     inner = _get_paginated_inner(output_annotation)
     if inner is not None:
-        input_data = input_instance.model_dump()
         try:
-            limit = int(input_data.get("limit", 10))
+            limit = int(getattr(input_instance, "limit", 10))
         except (TypeError, ValueError):
             limit = 10
         try:
-            offset = int(input_data.get("offset", 0))
+            offset = int(getattr(input_instance, "offset", 0))
         except (TypeError, ValueError):
             offset = 0
         limit = max(1, limit)
         offset = max(0, offset)
-        all_items = build_list(
+        # Build only the requested page; offsetting the seed keeps each page
+        # deterministic without generating (and discarding) earlier pages.
+        items = build_list(
             inner,
             input_model,
             input_instance,
-            count=offset + limit,
-            seed=seed,
+            count=limit,
+            seed=seed + offset if seed is not None else None,
             filter_by=filter_by,
             request=request,
         )
-        items = all_items[offset : offset + limit]
         total = offset + len(items)
-        return PaginatedResponse(items=items, total=total, limit=limit, offset=offset)
+        # Build the declared (parametrized) page class so it serializes as declared.
+        page: BaseModel = output_annotation(
+            items=items, total=total, limit=limit, offset=offset
+        )
+        return page
 
     # list[Model]
     origin = get_origin(output_annotation)
@@ -9,12 +9,24 @@ via the plugin system (register_link).
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, get_type_hints
 
+from semblance.plugins import is_registered, registry_generation
 
-@dataclass(frozen=True)
+
+def _intern_fields(link: object, *names: str) -> None:
+    """Intern the str-valued fields of a frozen link (faster lookups and ==)."""
+    for name in names:
+        value = getattr(link, name)
+        if type(value) is str:
+            object.__setattr__(link, name, sys.intern(value))
+
+
+@dataclass(frozen=True, slots=True)
 class FromInput:
     """Bind this output field to the value of a request input field by name.
 
@@ -25,8 +37,11 @@ class FromInput:
 
     field: str
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "field")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class DateRangeFrom:
     """Generate a datetime within the range defined by two date fields on input.
 
@@ -37,8 +52,11 @@ class DateRangeFrom:
     start: str
     end: str
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "start", "end")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WhenInput:
     """Apply the inner link only when condition_field equals condition_value.
 
@@ -51,8 +69,11 @@ class WhenInput:
     condition_value: Any
     then_link: FromInput | DateRangeFrom
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "condition_field", "condition_value")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ComputedFrom:
     """Compute this field from other output fields in the same model.
 
@@ -65,7 +86,7 @@ class ComputedFrom:
     fn: Callable[..., Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FromHeader:
     """Bind this output field to a request header by name.
 
@@ -76,8 +97,11 @@ class FromHeader:
 
     name: str
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "name")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FromCookie:
     """Bind this output field to a request cookie by name.
 
@@ -88,6 +112,46 @@ class FromCookie:
 
     name: str
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "name")
+
+
+# Built-in link types; exact-type membership is checked before isinstance.
+_LINK_TYPES: frozenset[type] = frozenset(
+    {FromInput, DateRangeFrom, WhenInput, ComputedFrom, FromHeader, FromCookie}
+)
+_LINK_TYPES_TUPLE = tuple(_LINK_TYPES)
+
+
+@lru_cache(maxsize=256)
+def _cached_type_hints(model_class: type) -> dict[str, Any]:
+    """
+    Return get_type_hints(model_class, include_extras=True), cached per class.
+
+    Failures (e.g. unresolved forward references) are not cached, so a later
+    call can succeed once the reference is defined. Do not mutate the result.
+    """
+    return get_type_hints(model_class, include_extras=True)
+
+
+def _get_all_hints(model_class: type) -> dict[str, Any]:
+    """Cached type hints for model_class, or {} if they cannot be resolved."""
+    try:
+        return _cached_type_hints(model_class)
+    except Exception:
+        return {}
+
+
+def _extract_link_from_annotation(annotation: Any) -> Any | None:
+    """Return the first Semblance link (built-in or registered) in Annotated metadata."""
+    # Annotated[T, x, y, ...] has __metadata__ as tuple of the extra args
+    for meta in getattr(annotation, "__metadata__", ()):
+        if type(meta) in _LINK_TYPES or is_registered(meta):
+            return meta
+        if isinstance(meta, _LINK_TYPES_TUPLE):  # subclasses of built-in links
+            return meta
+    return None
+
 
 def get_field_metadata(model_class: type, field_name: str) -> Any | None:
     """
@@ -95,17 +159,22 @@ def get_field_metadata(model_class: type, field_name: str) -> Any | None:
 
     Returns the first metadata that looks like a Semblance link (FromInput,
     DateRangeFrom, WhenInput, ComputedFrom, FromHeader, FromCookie) or a registered custom link.
-    Returns None if no link metadata is found.
+    Returns None if no link metadata is found. Model fields are answered from
+    a per-class map built on first use (see _field_links).
     """
-    import typing
-
-    hint = None
-    try:
-        # Prefer get_type_hints so we get full Annotated[T, ...] with __metadata__
-        annotations = typing.get_type_hints(model_class, include_extras=True)
-        hint = annotations.get(field_name)
-    except Exception:
-        pass
+    links = _model_links(model_class)
+    if field_name in links:
+        return links[field_name]
+    return _find_field_metadata(model_class, field_name)
+
+
+def _find_field_metadata(
+    model_class: type, field_name: str, hints: dict[str, Any] | None = None
+) -> Any | None:
+    # Prefer get_type_hints so we get full Annotated[T, ...] with __metadata__
+    if hints is None:
+        hints = _get_all_hints(model_class)
+    hint = hints.get(field_name)
     if (
         hint is None
         and hasattr(model_class, "model_fields")
@@ -114,24 +183,31 @@ def get_field_metadata(model_class: type, field_name: str) -> Any | None:
         hint = getattr(model_class.model_fields[field_name], "annotation", None)
     if hint is None:
         return None
+    return _extract_link_from_annotation(hint)
 
-    # Annotated[T, x, y, ...] has __metadata__ as tuple of the extra args
-    if hasattr(hint, "__metadata__"):
-        from semblance.plugins import is_registered
-
-        for meta in hint.__metadata__:
-            if isinstance(
-                meta,
-                (
-                    FromInput,
-                    DateRangeFrom,
-                    WhenInput,
-                    ComputedFrom,
-                    FromHeader,
-                    FromCookie,
-                ),
-            ):
-                return meta
-            if is_registered(meta):
-                return meta
-    return None
+
+@lru_cache(maxsize=256)
+def _field_links(model_class: type, generation: int) -> dict[str, Any]:
+    """
+    Map each model field to its link metadata (or None), cached per class.
+
+    generation is plugins.registry_generation(), so registering a link type
+    invalidates maps built before it. Raises (and caches nothing) while the
+    class's type hints cannot be resolved. Do not mutate the result.
+    """
+    hints = _cached_type_hints(model_class)
+    return {
+        name: _find_field_metadata(model_class, name, hints)
+        for name in getattr(model_class, "model_fields", {})
+    }
+
+
+def _model_links(model_class: type) -> dict[str, Any]:
+    """Field -> link metadata for model_class, cached once its hints resolve."""
+    try:
+        return _field_links(model_class, registry_generation())
+    except Exception:  # unresolved forward references or unhashable class
+        return {
+            name: _find_field_metadata(model_class, name)
+            for name in getattr(model_class, "model_fields", {})
+        }
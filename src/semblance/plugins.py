@@ -30,10 +30,24 @@ class LinkProtocol(Protocol):
 
 _REGISTRY: set[type] = set()
 
+# True until the first register_link; lets is_registered skip the lookup.
+_REGISTRY_EMPTY = True
+
+# Bumped by register_link so cached resolution plans can be invalidated.
+_generation = 0
+
 
 def register_link(link_class: type[LinkProtocol]) -> None:
     """Register a custom link type. The resolver will call meta.resolve(input_data, rng) for its instances."""
+    global _generation, _REGISTRY_EMPTY
     _REGISTRY.add(link_class)
+    _REGISTRY_EMPTY = False
+    _generation += 1
+
+
+def registry_generation() -> int:
+    """Return a counter that changes whenever a link type is registered."""
+    return _generation
 
 
 def get_registered_links() -> set[type]:
@@ -43,4 +57,4 @@ def get_registered_links() -> set[type]:
 
 def is_registered(meta: object) -> bool:
     """Check if meta's type is registered as a custom link."""
-    return type(meta) in _REGISTRY
+    return not _REGISTRY_EMPTY and type(meta) in _REGISTRY
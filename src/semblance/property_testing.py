@@ -9,10 +9,13 @@ from __future__ import annotations
 
 import json
 import re
+import types
 from collections.abc import Callable
-from typing import Annotated, Any, Protocol, get_args, get_origin
+from functools import lru_cache
+from typing import Annotated, Any, Protocol, Union, get_args, get_origin
+from urllib.parse import urlencode
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 try:
     from hypothesis import given
@@ -23,18 +26,32 @@ except ImportError as e:
     ) from e
 
 
-def _parse_path_params(path: str) -> list[str]:
-    """Extract path param names from template, e.g. '/users/{id}' -> ['id']."""
-    return re.findall(r"\{(\w+)\}", path)
+_PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
+
+
+@lru_cache(maxsize=256)
+def _parse_path_params(path: str) -> tuple[str, ...]:
+    """Extract path param names from template, e.g. '/users/{id}' -> ('id',)."""
+    return tuple(_PATH_PARAM_RE.findall(path))
+
+
+_UNION_ORIGINS: frozenset[Any] = frozenset({Union, types.UnionType})
 
 
 def _get_bare_annotation(annotation: type) -> type:
     """Strip Annotated and Union to get a concrete type for strategy generation."""
+    try:
+        return _cached_bare_annotation(annotation)
+    except TypeError:  # unhashable annotation: inspect it uncached
+        return _find_bare_annotation(annotation)
+
+
+def _find_bare_annotation(annotation: type) -> type:
     origin = get_origin(annotation)
     args = get_args(annotation)
     if origin is Annotated and args:
         return _get_bare_annotation(args[0])
-    if origin is type(None) or (origin is not None and "Union" in str(origin)) and args:
+    if origin in _UNION_ORIGINS:
         for a in args:
             if a is type(None):
                 continue
@@ -42,24 +59,37 @@ def _get_bare_annotation(annotation: type) -> type:
     return annotation
 
 
+_cached_bare_annotation = lru_cache(maxsize=1024)(_find_bare_annotation)
+
+
+# Strategies for exact primitive annotations; shared, since strategies are immutable.
+_PRIMITIVE_STRATEGIES: dict[Any, st.SearchStrategy[Any]] = {
+    type(None): st.none(),
+    str: st.text(),
+    int: st.integers(),
+    float: st.floats(allow_nan=False),
+    bool: st.booleans(),
+}
+
+
+# strategy_for_input_model results per model; strategies are stateless and reusable.
+_MODEL_STRATEGY_CACHE: dict[type[BaseModel], st.SearchStrategy[BaseModel]] = {}
+
+
 def _strategy_for_annotation(annotation: type) -> st.SearchStrategy[Any]:
     """Build a Hypothesis strategy for a single field annotation."""
     bare = _get_bare_annotation(annotation)
-    if bare is type(None):
-        return st.none()
+    try:
+        primitive = _PRIMITIVE_STRATEGIES.get(bare)
+    except TypeError:  # unhashable annotation
+        primitive = None
+    if primitive is not None:
+        return primitive
     try:
         if isinstance(bare, type) and issubclass(bare, BaseModel):
             return strategy_for_input_model(bare)
     except TypeError:
         pass
-    if bare is str:
-        return st.text()
-    if bare is int:
-        return st.integers()
-    if bare is float:
-        return st.floats(allow_nan=False)
-    if bare is bool:
-        return st.booleans()
     try:
         return st.from_type(bare)
     except Exception:
@@ -76,8 +106,11 @@ def strategy_for_input_model(
     Use for GET (query) or POST/PUT/PATCH (body) input. If path_template is
     given (e.g. '/users/{id}'), path param names are inferred; the strategy
     still generates full model instances (path params can be passed separately
-    when building the request).
+    when building the request). The strategy is cached per model.
     """
+    cached = _MODEL_STRATEGY_CACHE.get(model)
+    if cached is not None:
+        return cached
     strategies: dict[str, st.SearchStrategy[Any]] = {}
     for name, field in model.model_fields.items():
         ann = field.annotation
@@ -85,7 +118,9 @@ def strategy_for_input_model(
             strategies[name] = _strategy_for_annotation(ann)
         else:
             strategies[name] = st.none()
-    return st.builds(model, **strategies)
+    strategy = st.builds(model, **strategies)
+    _MODEL_STRATEGY_CACHE[model] = strategy
+    return strategy
 
 
 class _ResponseProtocol(Protocol):
@@ -167,33 +202,48 @@ def test_endpoint(
         k: (path_params.get(k) or "placeholder") for k in _parse_path_params(path)
     }
 
+    # Path params do not vary per example, so substitute them once.
+    base_url = _PATH_PARAM_RE.sub(
+        lambda m: str(path_params_from_template[m.group(1)]), path
+    )
+
+    adapter: TypeAdapter[Any] | None = (
+        TypeAdapter(output_model) if validate_response else None
+    )
+
+    # Pick the request function once; each returns (url, response).
+    method_upper = method.upper()
+    send: Callable[[dict[str, Any]], tuple[str, _ResponseProtocol]]
+    if method_upper == "GET":
+
+        def send(data: dict[str, Any]) -> tuple[str, _ResponseProtocol]:
+            query = urlencode(data)
+            url = f"{base_url}?{query}" if query else base_url
+            return url, client.get(url)
+
+    elif method_upper in ("POST", "PUT", "PATCH"):
+
+        def send(data: dict[str, Any]) -> tuple[str, _ResponseProtocol]:
+            return base_url, client.request(method_upper, base_url, json=data)
+
+    elif method_upper == "DELETE":
+
+        def send(data: dict[str, Any]) -> tuple[str, _ResponseProtocol]:
+            return base_url, client.delete(base_url)
+
+    else:
+        raise ValueError(f"Unsupported method {method}")
+
     @given(input_strategy)
     def _run(input_instance: BaseModel) -> None:
         data = input_instance.model_dump()
-        url = path
-        for key, val in path_params_from_template.items():
-            url = url.replace("{" + key + "}", str(val))
-        if method.upper() == "GET":
-            from urllib.parse import urlencode
-
-            query = urlencode(data)
-            url = f"{url}?{query}" if query else url
-            r = client.get(url)
-        elif method.upper() in ("POST", "PUT", "PATCH"):
-            r = client.request(method.upper(), url, json=data)
-        elif method.upper() == "DELETE":
-            r = client.delete(url)
-        else:
-            raise ValueError(f"Unsupported method {method}")
+        url, r = send(data)
         try:
             assert r.status_code in (200, 201, 204), (r.status_code, r.text)
             if r.status_code == 204:
                 return
             body = r.json()
-            if validate_response:
-                from pydantic import TypeAdapter
-
-                adapter: TypeAdapter[Any] = TypeAdapter(output_model)
+            if adapter is not None:
                 adapter.validate_python(body)
             for inv in invariants:
                 assert inv(input_instance, body), f"Invariant failed: {inv}"
@@ -205,12 +255,12 @@ def test_endpoint(
                 else data
             )
             curl_s = _repro_curl(
-                method.upper(),
+                method_upper,
                 url,
-                data_serializable if method.upper() != "GET" else None,
+                data_serializable if method_upper != "GET" else None,
             )
             py_s = _repro_python(
-                method.upper(),
+                method_upper,
                 path,
                 path_params_from_template,
                 data_serializable,
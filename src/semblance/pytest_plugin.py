@@ -14,9 +14,15 @@ from typing import Any
 
 import pytest
 
+# app_path -> loaded SemblanceAPI; each app is imported once per session.
+_APP_CACHE: dict[str, Any] = {}
+
 
 def _load_semblance_api(app_path: str) -> Any:
-    """Load SemblanceAPI from module:attr path."""
+    """Load SemblanceAPI from module:attr path (cached per path)."""
+    cached = _APP_CACHE.get(app_path)
+    if cached is not None:
+        return cached
     if ":" not in app_path:
         raise ValueError(
             f"Invalid app path {app_path!r}. Use module:attr (e.g. app:api)."
@@ -24,16 +30,19 @@ def _load_semblance_api(app_path: str) -> Any:
     module_path, attr = app_path.split(":", 1)
     if not module_path or not attr:
         raise ValueError("module:attr must both be non-empty")
-    spec = importlib.util.find_spec(module_path)
-    if spec is None or spec.loader is None:
-        raise ValueError(f"Module {module_path!r} not found")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_path] = module
-    spec.loader.exec_module(module)
+    module = sys.modules.get(module_path)
+    if module is None:
+        spec = importlib.util.find_spec(module_path)
+        if spec is None or spec.loader is None:
+            raise ValueError(f"Module {module_path!r} not found")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_path] = module
+        spec.loader.exec_module(module)
     if not hasattr(module, attr):
         raise ValueError(f"Attribute {attr!r} not found in module {module_path!r}")
     app = getattr(module, attr)
     if hasattr(app, "as_fastapi"):
+        _APP_CACHE[app_path] = app
         return app
     raise ValueError(f"{attr!r} is not a SemblanceAPI (no as_fastapi)")
 
@@ -72,7 +81,11 @@ def semblance_api(request: pytest.FixtureRequest) -> Any:
             "Test is not marked with @pytest.mark.semblance(app='module:attr') "
             "or @pytest.mark.semblance_property_tests(app='module:attr')"
         )
-    return _load_semblance_api(app_path)
+    api = _load_semblance_api(app_path)
+    # The instance is shared across tests; start each test with an empty store.
+    if hasattr(api, "clear_store"):
+        api.clear_store()
+    return api
 
 
 @pytest.fixture
@@ -6,16 +6,22 @@ Per-process, in-memory; for simulation only.
 """
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from threading import Lock
 
+# Number of lock stripes (power of two); keys hash to a stripe.
+_LOCK_STRIPES = 32
+
 
 class RateLimiter:
     """Sliding-window rate limiter keyed by (path, method)."""
 
+    __slots__ = ("_timestamps", "_locks")
+
     def __init__(self) -> None:
-        self._timestamps: dict[tuple[str, str], list[float]] = defaultdict(list)
-        self._lock = Lock()
+        self._timestamps: dict[tuple[str, str], deque[float]] = defaultdict(deque)
+        # Striped locks: independent endpoints rarely contend on the same lock.
+        self._locks = [Lock() for _ in range(_LOCK_STRIPES)]
 
     def check_and_record(self, path: str, method: str, limit: float) -> bool:
         """
@@ -25,15 +31,18 @@ class RateLimiter:
         """
         if limit <= 0:
             return True
-        now = time.monotonic()
         key = (path, method)
-        with self._lock:
-            ts_list = self._timestamps[key]
-            # Drop timestamps older than 1 second
-            ts_list[:] = [t for t in ts_list if now - t < 1.0]
-            if len(ts_list) >= limit:
+        with self._locks[hash(key) & (_LOCK_STRIPES - 1)]:
+            # Read the clock under the lock so appends stay in time order.
+            now = time.monotonic()
+            timestamps = self._timestamps[key]
+            # Timestamps are appended in order, so expired ones are at the left.
+            cutoff = now - 1.0
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            if len(timestamps) >= limit:
                 return False
-            ts_list.append(now)
+            timestamps.append(now)
         return True
 
 
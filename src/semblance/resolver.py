@@ -10,7 +10,9 @@ callables) for the Polyfactory layer.
 import random
 from collections.abc import Callable
 from datetime import date, datetime, timedelta
-from typing import Any, Protocol, get_origin
+from functools import lru_cache, partial
+from operator import itemgetter
+from typing import Any, NamedTuple, Protocol, get_origin
 
 from pydantic import BaseModel
 from starlette.requests import Request
@@ -22,34 +24,67 @@ from semblance.links import (
     FromHeader,
     FromInput,
     WhenInput,
-    get_field_metadata,
+    _extract_link_from_annotation,
+    _get_all_hints,
 )
-from semblance.plugins import is_registered
+from semblance.plugins import is_registered, registry_generation
+
+
+class _NestedSpec(NamedTuple):
+    """Override for a nested BaseModel field: build model with its own overrides."""
+
+    model: type[BaseModel]
+    overrides: dict[str, Any]
+
+
+class _ComputedSpec(NamedTuple):
+    """Override for a ComputedFrom field: fn(*values of fields) after other fields.
+
+    getter extracts the dependency values from the resolved dict in one call
+    (a single value when there is exactly one field, else a tuple).
+    """
+
+    fields: tuple[str, ...]
+    fn: Callable[..., Any]
+    getter: Callable[[dict[str, Any]], Any]
+
+
+def _no_dependencies(_: dict[str, Any]) -> tuple[()]:
+    return ()
+
+
+def _computed_spec(fields: tuple[str, ...], fn: Callable[..., Any]) -> _ComputedSpec:
+    """Build a _ComputedSpec with its dependency getter pre-bound."""
+    fields = tuple(fields)
+    getter = itemgetter(*fields) if fields else _no_dependencies
+    return _ComputedSpec(fields, fn, getter)
 
 
 class _RandomLike(Protocol):
-    def uniform(self, a: float, b: float) -> float: ...
+    def random(self) -> float: ...
 
 
 def _make_random_datetime_closure(
     start_dt: datetime, end_dt: datetime, rng: _RandomLike
 ) -> Callable[[], datetime]:
-    def fn(
-        s: datetime = start_dt,
-        e: datetime = end_dt,
-        r: _RandomLike = rng,
-    ) -> datetime:
-        delta = e - s
-        if delta.total_seconds() <= 0:
-            return s
-        sec = r.uniform(0, delta.total_seconds())
-        return s + timedelta(seconds=sec)
-
-    return fn
+    """Return fn() -> random datetime in [start_dt, end_dt]; the span is computed once."""
+    delta_s = (end_dt - start_dt).total_seconds()
+    if delta_s <= 0:
+        return lambda: start_dt
+    # Same value as rng.uniform(0, delta_s), without its Python-level wrapper.
+    random_ = rng.random
+    return lambda: start_dt + timedelta(seconds=delta_s * random_())
 
 
 def _get_nested_model(field_annotation: object) -> type[BaseModel] | None:
     """Extract BaseModel from field annotation (handles Optional[BaseModel])."""
+    try:
+        return _cached_nested_model(field_annotation)
+    except TypeError:  # unhashable annotation: inspect it uncached
+        return _find_nested_model(field_annotation)
+
+
+def _find_nested_model(field_annotation: object) -> type[BaseModel] | None:
     origin = get_origin(field_annotation)
     if origin is not None:
         args = getattr(field_annotation, "__args__", ())
@@ -62,6 +97,271 @@ def _get_nested_model(field_annotation: object) -> type[BaseModel] | None:
     return None
 
 
+_cached_nested_model = lru_cache(maxsize=4096)(_find_nested_model)
+
+
+@lru_cache(maxsize=256)
+def _dumped_names(model: type[BaseModel]) -> frozenset[str]:
+    """Names model_dump() emits for model (excluding extras)."""
+    names = {name for name, f in model.model_fields.items() if not f.exclude}
+    return frozenset(names.union(model.model_computed_fields))
+
+
+# Values model_dump() converts recursively; read these from the dump instead.
+_DUMPED_CONTAINERS = (BaseModel, list, tuple, set, frozenset, dict)
+
+# Exact types returned as-is; checked by identity before the isinstance above,
+# which for BaseModel goes through its metaclass's __instancecheck__.
+_PLAIN_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, type(None), date, datetime}
+)
+
+
+class _InputProxy:
+    """
+    Dict-like view of the request input that reads attributes on demand.
+
+    Links usually read one or two input fields, so get() uses getattr on the
+    validated instance instead of dumping the whole model. Container values
+    (and to_dict(), used for custom links) fall back to a model_dump() that
+    is computed at most once, so results match the dumped dict exactly.
+    """
+
+    __slots__ = ("_instance", "_names", "_data")
+
+    def __init__(self, instance: BaseModel) -> None:
+        self._instance = instance
+        self._names = _dumped_names(type(instance))
+        self._data: dict[str, Any] | None = None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name not in self._names and name not in (
+            self._instance.__pydantic_extra__ or ()
+        ):
+            return default
+        value = getattr(self._instance, name, default)
+        if type(value) in _PLAIN_TYPES:
+            return value
+        if isinstance(value, _DUMPED_CONTAINERS):
+            return self.to_dict().get(name, default)
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._instance.model_dump()
+        return self._data
+
+
+class _ResolveContext(NamedTuple):
+    """Per-request inputs shared by the field handlers of a resolution plan."""
+
+    input_model: type[BaseModel]
+    input_instance: BaseModel
+    input_data: _InputProxy
+    seed: int | None
+    rng: Any
+    request: Request | None
+
+
+_Resolver = Callable[[_ResolveContext], dict[str, Any]]
+
+
+def _resolve_nested(
+    nested: tuple[type[BaseModel], _Resolver], ctx: _ResolveContext
+) -> Any:
+    model, resolve = nested
+    # Nested models share the caller's RNG, seeded once per resolve_overrides.
+    return _NestedSpec(model, resolve(ctx))
+
+
+def _resolve_from_header(meta: FromHeader, ctx: _ResolveContext) -> Any:
+    return ctx.request.headers.get(meta.name) if ctx.request is not None else None
+
+
+def _resolve_from_cookie(meta: FromCookie, ctx: _ResolveContext) -> Any:
+    return ctx.request.cookies.get(meta.name) if ctx.request is not None else None
+
+
+def _resolve_from_input(meta: FromInput, ctx: _ResolveContext) -> Any:
+    # When the value is None (missing or optional input), no override is applied;
+    # Polyfactory will generate a value for the field.
+    return ctx.input_data.get(meta.field)
+
+
+def _resolve_date_range(meta: DateRangeFrom, ctx: _ResolveContext) -> Any:
+    start_val = ctx.input_data.get(meta.start)
+    end_val = ctx.input_data.get(meta.end)
+    if start_val is None or end_val is None:
+        return None
+    start = _to_datetime(start_val)
+    end = _to_datetime(end_val)
+    if start is None or end is None:
+        return None
+    return _make_random_datetime_closure(start, end, ctx.rng)
+
+
+class _WhenSpec(NamedTuple):
+    """A WhenInput link with the handler for its inner link looked up once."""
+
+    condition_field: str
+    condition_value: Any
+    handler: Callable[[Any, _ResolveContext], Any]
+    link: Any
+
+
+def _resolve_when_input(spec: _WhenSpec, ctx: _ResolveContext) -> Any:
+    if ctx.input_data.get(spec.condition_field) != spec.condition_value:
+        return None
+    return spec.handler(spec.link, ctx)
+
+
+def _resolve_computed(spec: _ComputedSpec, ctx: _ResolveContext) -> Any:
+    return spec
+
+
+def _resolve_custom(meta: Any, ctx: _ResolveContext) -> Any:
+    return meta.resolve(ctx.input_data.to_dict(), ctx.rng)
+
+
+_FieldHandler = Callable[[Any, _ResolveContext], Any]
+
+_LINK_HANDLERS: dict[type, _FieldHandler] = {
+    FromHeader: _resolve_from_header,
+    FromCookie: _resolve_from_cookie,
+    FromInput: _resolve_from_input,
+    WhenInput: _resolve_when_input,
+    DateRangeFrom: _resolve_date_range,
+}
+
+# Links allowed as WhenInput.then_link.
+_WHEN_HANDLERS: dict[type, _FieldHandler] = {
+    FromInput: _resolve_from_input,
+    DateRangeFrom: _resolve_date_range,
+}
+
+
+def _handler_for(meta: object, handlers: dict[type, _FieldHandler]) -> Any:
+    """Return the handler for type(meta) or its nearest base class, else None."""
+    return next((handlers[c] for c in type(meta).__mro__ if c in handlers), None)
+
+
+def _when_spec(meta: WhenInput) -> _WhenSpec | None:
+    inner = meta.then_link
+    handler = _handler_for(inner, _WHEN_HANDLERS)
+    if handler is None:
+        return None
+    return _WhenSpec(meta.condition_field, meta.condition_value, handler, inner)
+
+
+class _FieldPlan(NamedTuple):
+    """How to resolve one output field: handler(payload, ctx) -> override or None."""
+
+    name: str
+    handler: _FieldHandler
+    payload: Any
+
+
+@lru_cache(maxsize=256)
+def _resolution_plan(
+    output_model: type[BaseModel], generation: int
+) -> tuple[_FieldPlan, ...]:
+    """
+    Walk output_model's fields once and record how to resolve each linked field.
+
+    generation is plugins.registry_generation(), so registering a link type
+    invalidates plans built before it. Fields without links are omitted.
+    """
+    plan: list[_FieldPlan] = []
+    hints = _get_all_hints(output_model)
+    for name, field_info in output_model.model_fields.items():
+        annotation = field_info.annotation
+        nested_model = _get_nested_model(annotation or object)
+        if nested_model is not None:
+            plan.append(_FieldPlan(name, _resolve_nested, nested_model))
+            continue
+
+        meta = _extract_link_from_annotation(hints.get(name) or annotation)
+        if meta is None:
+            continue
+        if isinstance(meta, ComputedFrom):
+            spec = _computed_spec(meta.fields, meta.fn)
+            plan.append(_FieldPlan(name, _resolve_computed, spec))
+            continue
+        handler = _handler_for(meta, _LINK_HANDLERS)
+        if handler is _resolve_when_input:
+            when = _when_spec(meta)
+            if when is not None:  # unsupported then_link: never overrides
+                plan.append(_FieldPlan(name, handler, when))
+        elif handler is not None:
+            plan.append(_FieldPlan(name, handler, meta))
+        elif is_registered(meta):
+            plan.append(_FieldPlan(name, _resolve_custom, meta))
+    return tuple(plan)
+
+
+def _no_overrides(_: _ResolveContext) -> dict[str, Any]:
+    """Resolver for models without links or nested models."""
+    return {}
+
+
+def _from_input_resolver(pairs: tuple[tuple[str, str], ...]) -> _Resolver:
+    """Resolver for (output field, input field) pairs with no handler calls."""
+
+    def resolve(ctx: _ResolveContext) -> dict[str, Any]:
+        get = ctx.input_data.get
+        overrides: dict[str, Any] = {}
+        for name, field in pairs:
+            value = get(field)
+            if value is not None:
+                overrides[name] = value
+        return overrides
+
+    return resolve
+
+
+@lru_cache(maxsize=256)
+def _compiled_resolver(output_model: type[BaseModel], generation: int) -> _Resolver:
+    """
+    Specialize the resolution plan of output_model into a single function.
+
+    Handlers are pre-bound to their payloads, and ComputedFrom specs (which do
+    not depend on the request) are collected once into a template dict that
+    each call copies, so a call only runs the request-dependent handlers.
+    Nested models are bound to their own compiled resolvers, which share the
+    caller's request context instead of re-reading the input. Plans made only
+    of FromInput links get a resolver that reads the input fields directly.
+    """
+    plan = _resolution_plan(output_model, generation)
+    if plan and all(p.handler is _resolve_from_input for p in plan):
+        return _from_input_resolver(tuple((p.name, p.payload.field) for p in plan))
+
+    template: dict[str, Any] = {}
+    steps: list[tuple[str, Callable[[_ResolveContext], Any]]] = []
+    for name, handler, payload in plan:
+        if handler is _resolve_computed:
+            template[name] = payload
+        elif handler is _resolve_nested:
+            nested = (payload, _compiled_resolver(payload, generation))
+            steps.append((name, partial(_resolve_nested, nested)))
+        else:
+            steps.append((name, partial(handler, payload)))
+    if not steps and not template:
+        return _no_overrides
+    bound = tuple(steps)
+
+    def resolve(ctx: _ResolveContext) -> dict[str, Any]:
+        overrides: dict[str, Any] = {}
+        for name, step in bound:
+            value = step(ctx)
+            if value is not None:
+                overrides[name] = value
+        # Computed fields are resolved last by the factory; keep them after.
+        overrides.update(template)
+        return overrides
+
+    return resolve
+
+
 def resolve_overrides(
     output_model: type[BaseModel],
     input_model: type[BaseModel],
@@ -75,90 +375,23 @@ def resolve_overrides(
     Walks output_model fields, inspects Annotated metadata for links, and
     resolves each against input_instance (and optionally request for
     FromHeader/FromCookie). Returns mapping field_name -> value or callable() -> value.
-    For nested BaseModel fields, value is {_nested: model, _overrides: dict}.
-    When seed is set, uses a seeded RNG for determinism.
+    For nested BaseModel fields, value is a _NestedSpec; for ComputedFrom, a
+    _ComputedSpec. The field walk is compiled once per model (see
+    _compiled_resolver). When seed is set, uses a seeded RNG for determinism.
     """
-    overrides: dict[str, Any] = {}
-    input_data = input_instance.model_dump()
-    rng = random.Random(seed) if seed is not None else random
-
-    for name in output_model.model_fields:
-        field_info = output_model.model_fields.get(name)
-        if field_info is not None:
-            nested_model = _get_nested_model(
-                getattr(field_info, "annotation", None) or object
-            )
-            if nested_model is not None:
-                nested_overrides = resolve_overrides(
-                    nested_model,
-                    input_model,
-                    input_instance,
-                    seed=seed,
-                    request=request,
-                )
-                overrides[name] = {
-                    "_nested": nested_model,
-                    "_overrides": nested_overrides,
-                }
-                continue
-
-        meta = get_field_metadata(output_model, name)
-        if meta is None:
-            continue
-
-        if isinstance(meta, FromHeader):
-            if request is not None:
-                val = request.headers.get(meta.name)
-                if val is not None:
-                    overrides[name] = val
-        elif isinstance(meta, FromCookie):
-            if request is not None:
-                val = request.cookies.get(meta.name)
-                if val is not None:
-                    overrides[name] = val
-        elif isinstance(meta, FromInput):
-            val = input_data.get(meta.field)
-            # When val is None (missing or optional input), no override is applied;
-            # Polyfactory will generate a value for the field.
-            if val is not None:
-                overrides[name] = val
-
-        elif isinstance(meta, WhenInput):
-            if input_data.get(meta.condition_field) == meta.condition_value:
-                inner = meta.then_link
-                if isinstance(inner, FromInput):
-                    val = input_data.get(inner.field)
-                    if val is not None:
-                        overrides[name] = val
-                elif isinstance(inner, DateRangeFrom):
-                    start_val = input_data.get(inner.start)
-                    end_val = input_data.get(inner.end)
-                    if start_val is not None and end_val is not None:
-                        start = _to_datetime(start_val)
-                        end = _to_datetime(end_val)
-                        if start is not None and end is not None:
-                            overrides[name] = _make_random_datetime_closure(
-                                start, end, rng
-                            )
-
-        elif isinstance(meta, DateRangeFrom):
-            start_val = input_data.get(meta.start)
-            end_val = input_data.get(meta.end)
-            if start_val is not None and end_val is not None:
-                start = _to_datetime(start_val)
-                end = _to_datetime(end_val)
-                if start is not None and end is not None:
-                    overrides[name] = _make_random_datetime_closure(start, end, rng)
-
-        elif isinstance(meta, ComputedFrom):
-            overrides[name] = {"_computed": meta.fields, "_fn": meta.fn}
-
-        elif is_registered(meta):
-            val = meta.resolve(input_data, rng)
-            if val is not None:
-                overrides[name] = val
-
-    return overrides
+    resolve = _compiled_resolver(output_model, registry_generation())
+    if resolve is _no_overrides:
+        return {}  # plain model: skip building the request context
+    return resolve(
+        _ResolveContext(
+            input_model,
+            input_instance,
+            _InputProxy(input_instance),
+            seed,
+            random.Random(seed) if seed is not None else random,
+            request,
+        )
+    )
 
 
 def _to_datetime(value: Any) -> datetime | None:
@@ -170,18 +403,31 @@ def _to_datetime(value: Any) -> datetime | None:
     if isinstance(value, date) and not isinstance(value, datetime):
         return datetime.combine(value, datetime.min.time())
     if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
-        except ValueError:
-            pass
+        return _parse_iso_datetime(value)
     return None
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_datetime(value: str) -> datetime | None:
+    """Parse an ISO datetime string ("Z" allowed); cached since bounds repeat."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
 def get_output_model_for_type(annotation: type) -> type[BaseModel] | None:
     """
     Resolve the concrete output model from an annotation like T or list[T].
     Returns the inner model for list[T], or the type itself for a single model.
     """
+    try:
+        return _cached_output_model(annotation)
+    except TypeError:  # unhashable annotation: inspect it uncached
+        return _find_output_model(annotation)
+
+
+def _find_output_model(annotation: type) -> type[BaseModel] | None:
     origin = get_origin(annotation)
     if origin is list:
         args = getattr(annotation, "__args__", ())
@@ -190,3 +436,6 @@ def get_output_model_for_type(annotation: type) -> type[BaseModel] | None:
     if isinstance(annotation, type) and issubclass(annotation, BaseModel):
         return annotation
     return None
+
+
+_cached_output_model = lru_cache(maxsize=256)(_find_output_model)
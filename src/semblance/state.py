@@ -5,44 +5,140 @@ When SemblanceAPI(stateful=True), POST endpoints store created instances
 and GET list endpoints return stored instances. State is process-local.
 """
 
+import math
 import uuid
+from functools import lru_cache
+from typing import Any
 
 from pydantic import BaseModel
 
 
+def _has_non_finite_float(content: Any) -> bool:
+    """True if a JSON-compatible value contains NaN or an infinite float."""
+    stack = [content]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+@lru_cache(maxsize=256)
+def _id_mode(model_cls: type[BaseModel]) -> int:
+    """0: no id field; 1: str id, set via model_copy; 2: other id, revalidate."""
+    field = model_cls.model_fields.get("id")
+    if field is None:
+        return 0
+    return 1 if field.annotation in (str, str | None) else 2
+
+
 class StatefulStore:
     """In-memory store for created instances, keyed by path."""
 
+    __slots__ = ("_store", "_index", "_json")
+
     def __init__(self) -> None:
         self._store: dict[str, list[BaseModel]] = {}
+        # path -> id_field -> {id value: position of its first item}, built
+        # lazily by _position; dropped when items are removed or re-keyed.
+        self._index: dict[str, dict[str, dict[Any, int]]] = {}
+        # path -> (JSON array of the items or None if their types differ, the
+        # items' model or None if empty); dropped whenever the collection changes.
+        self._json: dict[str, tuple[bytes | None, type[BaseModel] | None]] = {}
+
+    def _position(
+        self, collection_path: str, items: list[BaseModel], id_value: Any, id_field: str
+    ) -> int | None:
+        """Return the position of the first item whose id_field equals id_value."""
+        indexes = self._index.setdefault(collection_path, {})
+        index = indexes.get(id_field)
+        try:
+            if index is None:
+                index = {}
+                for i, item in enumerate(items):
+                    index.setdefault(getattr(item, id_field, None), i)
+                indexes[id_field] = index
+            return index.get(id_value)
+        except TypeError:  # unhashable id values: fall back to a scan
+            for i, item in enumerate(items):
+                if getattr(item, id_field, None) == id_value:
+                    return i
+            return None
 
     def add(self, path: str, instance: BaseModel) -> BaseModel:
         """Add an instance to the store. Ensures id field if present. Returns the instance."""
-        if "id" in type(instance).model_fields:
-            data = instance.model_dump()
-            if data.get("id") in (None, ""):
-                data["id"] = str(uuid.uuid4())
-                model_cls = type(instance)
-                instance = model_cls.model_validate(data)
-
-        if path not in self._store:
-            self._store[path] = []
-        self._store[path].append(instance)
+        mode = _id_mode(type(instance))
+        if mode and getattr(instance, "id", None) in (None, ""):
+            new_id = str(uuid.uuid4())
+            if mode == 1:
+                # A str id needs no coercion, so skip dump-and-revalidate.
+                instance = instance.model_copy(update={"id": new_id})
+            else:
+                data = instance.model_dump()
+                data["id"] = new_id
+                instance = type(instance).model_validate(data)
+
+        items = self._store.setdefault(path, [])
+        items.append(instance)
+        self._json.pop(path, None)
+        indexes = self._index.get(path)
+        if indexes:
+            try:
+                for id_field, index in indexes.items():
+                    index.setdefault(getattr(instance, id_field, None), len(items) - 1)
+            except TypeError:
+                del self._index[path]
         return instance
 
     def get_all(self, path: str) -> list[BaseModel]:
         """Return all stored instances for path."""
         return list(self._store.get(path, []))
 
+    def get_all_json(self, path: str, model: type[BaseModel]) -> bytes | None:
+        """
+        Return the stored instances for path as a JSON array (by alias).
+
+        The bytes are cached until the collection changes. Returns None unless
+        every item is exactly model, since other items would need conversion,
+        and for NaN/inf floats, which pydantic writes as null but a regular
+        JSON response rejects.
+        """
+        cached = self._json.get(path)
+        if cached is None:
+            items = self._store.get(path, [])
+            types = {type(item) for item in items}
+            if len(types) > 1:
+                cached = (None, None)
+            else:
+                array = b"[%s]" % b",".join(
+                    item.model_dump_json(by_alias=True).encode() for item in items
+                )
+                if b"null" in array and any(
+                    _has_non_finite_float(item.model_dump()) for item in items
+                ):
+                    cached = (None, None)
+                else:
+                    cached = (array, types.pop() if types else None)
+            self._json[path] = cached
+        payload, common = cached
+        if payload is not None and (common is None or common is model):
+            return payload
+        return None
+
     def get_by_id(
         self, collection_path: str, id_value: str, id_field: str = "id"
     ) -> BaseModel | None:
         """Find item in collection whose id_field equals id_value. Return None if not found."""
-        items = self._store.get(collection_path, [])
-        for item in items:
-            if getattr(item, id_field, None) == id_value:
-                return item
-        return None
+        items = self._store.get(collection_path)
+        if not items:
+            return None
+        i = self._position(collection_path, items, id_value, id_field)
+        return None if i is None else items[i]
 
     def update(
         self,
@@ -52,29 +148,41 @@ class StatefulStore:
         id_field: str = "id",
     ) -> BaseModel | None:
         """Replace item with matching id with instance. Return updated instance or None."""
-        if collection_path not in self._store:
+        items = self._store.get(collection_path)
+        if not items:
             return None
-        items = self._store[collection_path]
-        for i, item in enumerate(items):
-            if getattr(item, id_field, None) == id_value:
-                items[i] = instance
-                return instance
-        return None
+        i = self._position(collection_path, items, id_value, id_field)
+        if i is None:
+            return None
+        previous, items[i] = items[i], instance
+        self._json.pop(collection_path, None)
+        indexes = self._index.get(collection_path, {})
+        if any(
+            getattr(previous, f, None) != getattr(instance, f, None) for f in indexes
+        ):
+            del self._index[collection_path]  # item was re-keyed
+        return instance
 
     def remove(self, collection_path: str, id_value: str, id_field: str = "id") -> bool:
         """Remove item with matching id. Return True if found and removed."""
-        if collection_path not in self._store:
+        items = self._store.get(collection_path)
+        if not items:
             return False
-        items = self._store[collection_path]
-        for i, item in enumerate(items):
-            if getattr(item, id_field, None) == id_value:
-                items.pop(i)
-                return True
-        return False
+        i = self._position(collection_path, items, id_value, id_field)
+        if i is None:
+            return False
+        items.pop(i)
+        self._index.pop(collection_path, None)  # later positions shifted
+        self._json.pop(collection_path, None)
+        return True
 
     def clear(self, path: str | None = None) -> None:
         """Clear store for path, or all paths if path is None."""
         if path is None:
             self._store.clear()
-        elif path in self._store:
-            del self._store[path]
+            self._index.clear()
+            self._json.clear()
+        else:
+            self._store.pop(path, None)
+            self._index.pop(path, None)
+            self._json.pop(path, None)
@@ -5,6 +5,7 @@ Validates link bindings (FromInput, DateRangeFrom, WhenInput, ComputedFrom)
 so missing or invalid references surface at startup or via `semblance validate`.
 """
 
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -14,25 +15,46 @@ from semblance.links import (
     DateRangeFrom,
     FromInput,
     WhenInput,
-    get_field_metadata,
+    _model_links,
 )
+from semblance.plugins import registry_generation
 from semblance.resolver import _get_nested_model, get_output_model_for_type
 
 
+@lru_cache(maxsize=256)
+def _has_links(output_model: type[BaseModel], generation: int) -> bool:
+    """
+    True if any field of output_model has link metadata or is a nested model.
+
+    generation (plugins.registry_generation()) only keys the cache.
+    """
+    links = _model_links(output_model)
+    return any(
+        links[name] is not None
+        or _get_nested_model(field_info.annotation or object) is not None
+        for name, field_info in output_model.model_fields.items()
+    )
+
+
 def _validate_output_links(
     output_model: type[BaseModel],
     input_model: type[BaseModel],
+    input_fields: frozenset[str],
     path: str,
     method: str,
     errors: list[str],
     prefix: str = "",
 ) -> None:
-    """Recursively validate output model link metadata against input model."""
-    input_fields = set(input_model.model_fields)
-    output_fields = set(output_model.model_fields)
+    """
+    Recursively validate output model link metadata against input model.
+
+    input_fields is frozenset(input_model.model_fields), built once by the
+    caller and shared by the nested recursion.
+    """
+    output_fields = output_model.model_fields
+    links = _model_links(output_model)
 
-    for field_name in output_model.model_fields:
-        meta = get_field_metadata(output_model, field_name)
+    for field_name, meta in links.items():
         field_prefix = f"{prefix}{field_name}" if prefix else field_name
 
         if meta is None:
@@ -45,6 +67,7 @@ def _validate_output_links(
                     _validate_output_links(
                         nested,
                         input_model,
+                        input_fields,
                         path,
                         method,
                         errors,
@@ -120,9 +143,12 @@ def validate_specs(
             continue
         if not isinstance(input_model, type) or not issubclass(input_model, BaseModel):
             continue
+        if not _has_links(output_model, registry_generation()):
+            continue
         _validate_output_links(
             output_model,
             input_model,
+            frozenset(input_model.model_fields),
             path,
             method,
             errors,
@@ -133,22 +159,25 @@ def validate_specs(
 def get_duplicate_endpoint_errors(specs: list[Any]) -> list[str]:
     """
     Check for duplicate (path, method) registrations.
-    Returns a list of error messages; empty if none.
+    Methods are compared case-insensitively (a missing method counts as GET).
+    Returns one message per duplicated (path, method); empty if none.
     """
-    errors: list[str] = []
-    seen: set[tuple[str, str]] = set()
+    counts: dict[tuple[str, str], int] = {}
     for spec in specs:
         path = getattr(spec, "path", None)
         methods = getattr(spec, "methods", None)
         if path is None or methods is None:
             continue
         for method in methods:
-            key = (path, method)
-            if key in seen:
-                method_upper = (method or "GET").upper()
-                errors.append(
-                    f"Duplicate {method_upper} endpoint registered for path {path!r}. "
-                    "Register only one handler per (path, method)."
-                )
-            seen.add(key)
+            key = (path, method.upper() if method else "GET")
+            counts[key] = counts.get(key, 0) + 1
+    errors: list[str] = []
+    for (path, method), count in counts.items():
+        if count < 2:
+            continue
+        times = f" ({count} registrations)" if count > 2 else ""
+        errors.append(
+            f"Duplicate {method} endpoint registered for path {path!r}{times}. "
+            "Register only one handler per (path, method)."
+        )
     return errors
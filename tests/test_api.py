@@ -230,3 +230,163 @@ def test_from_cookie_binding():
     data = r.json()
     assert data["name"] == "bob"
     assert data["session"] == "sess-abc"
+
+
+def test_orjson_response_class_when_available(api):
+    """With orjson installed, apps render JSON with it and fall back for big ints."""
+    pytest.importorskip("orjson")
+    from semblance.api import _ORJSONResponse
+
+    app = api.as_fastapi()
+    assert app.router.default_response_class is _ORJSONResponse
+    assert _ORJSONResponse({"a": 1, 2: "b"}).body == b'{"a":1,"2":"b"}'
+    assert _ORJSONResponse({"n": 2**70}).body == b'{"n":1180591620717411303424}'
+    r = client_for(app).get("/users?name=o")
+    assert r.status_code == 200
+    assert r.json()[0]["name"] == "o"
+
+
+def test_generated_responses_are_serialized_directly():
+    """Exact output instances become JSON Responses; other values pass through."""
+    from fastapi.responses import Response
+
+    from semblance.api import EndpointSpec, _build_handler_plan, _render
+
+    class Other(BaseModel):
+        name: str
+
+    spec = EndpointSpec("/users", ["GET"], UserQuery, list[User], lambda: None)
+    plan = _build_handler_plan(spec)
+    users = [User(name="a", created_at="2024-01-01T00:00:00")]
+    rendered = _render(plan, users)
+    assert isinstance(rendered, Response)
+    assert rendered.body == b'[{"name":"a","created_at":"2024-01-01T00:00:00"}]'
+    mixed = [*users, Other(name="b")]
+    assert _render(plan, mixed) is mixed
+
+
+def test_handler_plan_records_skippable_branches():
+    """Routes without rate limits, latency or a dynamic count skip those steps."""
+    from semblance.api import EndpointSpec, _build_handler_plan
+
+    plain = _build_handler_plan(
+        EndpointSpec("/users", ["GET"], UserQuery, list[User], lambda: None)
+    )
+    assert not plain.rate_limited
+    assert not plain.simulates_latency
+    assert plain.fixed_list_count == 5
+
+    dynamic = _build_handler_plan(
+        EndpointSpec(
+            "/users",
+            ["GET"],
+            UserQuery,
+            list[User],
+            lambda: None,
+            list_count="limit",
+            rate_limit=10,
+            jitter_ms=5,
+        )
+    )
+    assert dynamic.rate_limited
+    assert dynamic.simulates_latency
+    assert dynamic.fixed_list_count is None
+
+
+def test_as_fastapi_caches_app_until_registration():
+    """Repeated as_fastapi calls reuse the app; registering rebuilds it."""
+    api = SemblanceAPI()
+    api.get("/users", input=UserQuery, output=list[User])(lambda: None)
+    app = api.as_fastapi()
+    assert api.as_fastapi() is app
+
+    api.get("/users/{name}", input=UserQuery, output=User)(lambda: None)
+    rebuilt = api.as_fastapi()
+    assert rebuilt is not app
+    assert client_for(rebuilt).get("/users/alice").json()["name"] == "alice"
+
+    api.get("/users", input=UserQuery, output=list[User])(lambda: None)
+    with pytest.raises(ValueError, match="Duplicate GET endpoint"):
+        api.as_fastapi()
+
+
+def test_test_client_returns_independent_clients(api):
+    """Each test_client call is a fresh client; configuration never leaks."""
+    app = api.as_fastapi()
+    client = client_for(app)
+    client.headers["X-Test"] = "1"
+    client.cookies.set("session", "abc")
+    other = client_for(app)
+    assert other is not client
+    assert "X-Test" not in other.headers
+    assert not other.cookies
+
+
+def test_int_seed_and_list_count_fields_are_read_directly():
+    """Plain int seed_from/list_count fields skip coercion; others still coerce."""
+    from semblance.api import EndpointSpec, _build_handler_plan
+
+    class Query(BaseModel):
+        name: str = ""
+        limit: int = 3
+        seed: int = 7
+        label: str = "4"
+
+    plan = _build_handler_plan(
+        EndpointSpec(
+            "/users",
+            ["GET"],
+            Query,
+            list[User],
+            lambda: None,
+            list_count="limit",
+            seed_from="seed",
+        )
+    )
+    assert plan.seed_getter is not None and plan.list_count_getter is not None
+    api = SemblanceAPI()
+    q = Query()
+    assert api._resolve_seed("seed", q, plan.seed_getter) == 7
+    assert api._resolve_list_count("limit", q, plan.list_count_getter) == 3
+    assert api._resolve_list_count("limit", Query(limit=0), plan.list_count_getter) == 1
+
+    coerced = _build_handler_plan(
+        EndpointSpec(
+            "/users", ["GET"], Query, list[User], lambda: None, list_count="label"
+        )
+    )
+    assert coerced.list_count_getter is None
+    assert api._resolve_list_count("label", q) == 4
+
+
+def test_orjson_response_rejects_non_finite_floats_like_json_response():
+    """NaN/inf raise as with Starlette's JSONResponse instead of becoming null."""
+    pytest.importorskip("orjson")
+    from fastapi.responses import JSONResponse
+
+    from semblance.api import _ORJSONResponse
+
+    assert _ORJSONResponse({"a": None, "b": [1.5]}).body == b'{"a":null,"b":[1.5]}'
+    for value in (float("nan"), float("inf"), float("-inf")):
+        with pytest.raises(ValueError):
+            JSONResponse({"x": [value]})
+        with pytest.raises(ValueError):
+            _ORJSONResponse({"x": [value]})
+
+
+def test_render_leaves_non_finite_floats_to_fastapi():
+    """Responses with NaN are not pre-serialized (pydantic would write null)."""
+    from semblance.api import EndpointSpec, _build_handler_plan, _render
+
+    class Reading(BaseModel):
+        value: float | None = None
+
+    class ReadingQuery(BaseModel):
+        pass
+
+    plan = _build_handler_plan(
+        EndpointSpec("/r", ["GET"], ReadingQuery, Reading, lambda: None)
+    )
+    assert _render(plan, Reading()).body == b'{"value":null}'
+    nan = Reading(value=float("nan"))
+    assert _render(plan, nan) is nan
@@ -1,15 +1,19 @@
 """Unit tests for semblance.export helpers and edge cases."""
 
+import asyncio
 import json
 
 from fastapi import FastAPI
 
+from semblance import export
 from semblance.export import (
     _fill_path_params,
     _get_routes,
+    export_all,
     export_fixtures,
     export_openapi,
 )
+from tests.sample_app import app as sample_app
 
 
 def test_fill_path_params_single_param():
@@ -99,3 +103,72 @@ def test_export_fixtures_empty_app(tmp_path):
     # No other JSON fixture files (only openapi.json)
     json_files = list(tmp_path.glob("*.json"))
     assert len(json_files) == 1
+
+
+def test_export_all_writes_fixtures_and_schema_with_examples(tmp_path):
+    """export_all samples once and feeds both fixtures and schema examples."""
+    schema = export_all(sample_app, tmp_path)
+    users_get = json.loads((tmp_path / "users_GET.json").read_text())
+    assert isinstance(users_get, list)
+    written = json.loads((tmp_path / "openapi.json").read_text())
+    responses = written["paths"]["/users"]["get"]["responses"]
+    assert responses["200"]["content"]["application/json"]["example"] == users_get
+    assert written == schema
+
+
+def test_dumps_json_matches_stdlib_without_orjson(monkeypatch):
+    """Export encoding falls back to stdlib json when orjson is unavailable."""
+    payload = {"name": "café", "items": [1, 2.5, None, True], "big": 2**70}
+    fast = export._dumps_json(payload)
+    monkeypatch.setattr(export, "orjson", None)
+    slow = export._dumps_json(payload)
+    assert json.loads(fast) == json.loads(slow) == payload
+    assert slow == json.dumps(payload, indent=2).encode()
+
+
+def test_export_passes_lifespan_state_to_requests(tmp_path):
+    """State yielded by the app's lifespan reaches every sampled request."""
+    from contextlib import asynccontextmanager
+
+    from fastapi import Request
+
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        yield {"db": {"name": "from-lifespan"}}
+        events.append("shutdown")
+
+    app = FastAPI(lifespan=lifespan)
+
+    @app.get("/items")
+    def items(request: Request):
+        return {"db": request.state.db["name"]}
+
+    export_fixtures(app, tmp_path)
+    data = json.loads((tmp_path / "items_GET.json").read_text())
+    assert data == {"db": "from-lifespan"}
+    schema = export_openapi(app, include_examples=True)
+    example = schema["paths"]["/items"]["get"]["responses"]["200"]["content"]
+    assert example["application/json"]["example"] == {"db": "from-lifespan"}
+    assert events == ["startup", "shutdown"] * 2
+
+
+def test_export_samples_writes_before_later_reads(tmp_path):
+    """A write is sampled before the reads that follow it in the schema."""
+    app = FastAPI()
+    store: list[int] = []
+
+    @app.post("/items")
+    async def create():
+        await asyncio.sleep(0.01)
+        store.append(1)
+        return {"created": len(store)}
+
+    @app.get("/count")
+    def count():
+        return {"count": len(store)}
+
+    export_fixtures(app, tmp_path)
+    assert json.loads((tmp_path / "count_GET.json").read_text()) == {"count": 1}
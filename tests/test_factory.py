@@ -6,13 +6,17 @@ from typing import Annotated
 import pytest
 from pydantic import BaseModel
 
-from semblance import FromInput
+from semblance import ComputedFrom, FromInput
 from semblance.factory import (
+    _builder_for,
+    _factory_for,
+    _override_evaluator,
     build_list,
     build_one,
     build_response,
 )
 from semblance.pagination import PaginatedResponse
+from semblance.resolver import _computed_spec
 from tests.example_models import User, UserQuery
 
 
@@ -34,6 +38,26 @@ def test_build_list_with_seed_produces_deterministic_results():
     assert [u.created_at for u in r1] == [u.created_at for u in r2]
 
 
+def test_factory_class_is_reused_per_model():
+    """The Polyfactory factory class is created once per output model."""
+    assert _factory_for(User) is _factory_for(User)
+    assert _factory_for(User) is not _factory_for(UserQuery)
+
+
+def test_builder_instantiates_fully_overridden_model_directly():
+    """A model whose fields are all overridden matches the Polyfactory build."""
+
+    class Pair(BaseModel):
+        a: str
+        b: int
+
+    resolved = {"a": "x", "b": 2}
+    assert _builder_for(Pair)(resolved) == _factory_for(Pair).build(**resolved)
+    partial = _builder_for(Pair)({"a": "x"})
+    assert partial.a == "x"
+    assert isinstance(partial.b, int)
+
+
 def test_build_response_single_with_seed():
     """build_response for single model with seed uses seed_random."""
     query = UserQuery(name="single_seed")
@@ -79,6 +103,21 @@ def test_pagination_limit_offset_fallback_on_invalid_offset():
     assert result.offset == 0  # fallback
 
 
+def test_pagination_builds_only_requested_page_with_offset_seed():
+    """A seeded page is built from seed + offset with exactly limit items."""
+
+    class PagedQuery(BaseModel):
+        name: str = "paged"
+        limit: int = 3
+        offset: int = 4
+
+    query = PagedQuery()
+    page = build_response(PaginatedResponse[User], PagedQuery, query, seed=10)
+    expected = build_list(User, PagedQuery, query, count=3, seed=14)
+    assert page.items == expected
+    assert page.total == 7
+
+
 def test_build_response_invalid_single_model_raises():
     """build_response with non-BaseModel single type raises TypeError."""
     query = UserQuery(name="x")
@@ -106,6 +145,54 @@ def test_evaluate_overrides_callable_path():
     assert result.created_at is not None
 
 
+def test_override_evaluator_resolves_static_values_once():
+    """Static overrides are reused; callables and computed fields run per build."""
+    calls = []
+
+    def tick():
+        calls.append(1)
+        return len(calls)
+
+    evaluate = _override_evaluator(
+        {
+            "name": "static",
+            "n": tick,
+            "label": _computed_spec(("name", "n"), lambda a, b: f"{a}-{b}"),
+        }
+    )
+    assert evaluate() == {"name": "static", "n": 1, "label": "static-1"}
+    assert evaluate() == {"name": "static", "n": 2, "label": "static-2"}
+
+    assert _override_evaluator({"k": _computed_spec((), lambda: 0)})() == {"k": 0}
+
+    static_only = _override_evaluator({"name": "x"})
+    assert static_only() is static_only()
+
+
+def test_build_one_resolves_multi_level_nesting():
+    """Nested models (and their computed fields) resolve at every depth."""
+
+    class City(BaseModel):
+        name: Annotated[str, FromInput("city")]
+        label: Annotated[str, ComputedFrom(("name",), lambda n: n.upper())]
+
+    class Address(BaseModel):
+        city: City
+
+    class Person(BaseModel):
+        name: Annotated[str, FromInput("name")]
+        address: Address
+
+    class Query(BaseModel):
+        name: str = "ann"
+        city: str = "Oslo"
+
+    person = build_one(Person, Query, Query(), seed=3)
+    assert person.name == "ann"
+    assert person.address.city.name == "Oslo"
+    assert person.address.city.label == "OSLO"
+
+
 def test_build_list_with_filter_by():
     """build_list with filter_by returns items matching input field value."""
     query = UserQuery(name="alice")
@@ -115,6 +202,45 @@ def test_build_list_with_filter_by():
         assert item.name == "alice"
 
 
+def test_build_list_filter_by_forces_unlinked_field():
+    """filter_by sets an unlinked output field to the input value on every item."""
+
+    class Item(BaseModel):
+        status: str
+
+    class Query(BaseModel):
+        status: str = "rare-value"
+
+    result = build_list(Item, Query, Query(), count=4, filter_by="status", seed=2)
+    assert [item.status for item in result] == ["rare-value"] * 4
+
+
+def test_build_list_filter_by_invalid_input_value_returns_empty():
+    """An input value the output field cannot accept yields no items."""
+
+    class Item(BaseModel):
+        rank: int
+
+    class Query(BaseModel):
+        rank: str = "not-a-number"
+
+    assert build_list(Item, Query, Query(), count=3, filter_by="rank") == []
+
+
+def test_build_list_filter_by_pinned_mismatch_returns_empty():
+    """A filter_by field pinned to a different input value yields no items."""
+
+    class Out(BaseModel):
+        name: Annotated[str, FromInput("alias")]
+
+    class Query(BaseModel):
+        name: str = "alice"
+        alias: str = "bob"
+
+    result = build_list(Out, Query, Query(), count=3, filter_by="name", seed=1)
+    assert result == []
+
+
 def test_build_response_paginated_with_filter_by():
     """build_response with PaginatedResponse and filter_by filters items correctly."""
 
@@ -141,3 +267,11 @@ def test_build_response_paginated_with_filter_by():
     assert len(result.items) <= 3
     for item in result.items:
         assert item.status == "active"
+
+
+def test_override_evaluator_flat_callables_are_called_per_build():
+    """Callable-only overrides are re-evaluated per build, keeping static values."""
+    counter = iter(range(10))
+    evaluate = _override_evaluator({"name": "x", "n": lambda: next(counter)})
+    assert evaluate() == {"name": "x", "n": 0}
+    assert evaluate() == {"name": "x", "n": 1}
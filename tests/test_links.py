@@ -1,5 +1,6 @@
 """Tests for semblance.links (FromInput, DateRangeFrom, get_field_metadata)."""
 
+import sys
 from datetime import date, datetime
 from typing import Annotated
 
@@ -55,3 +56,60 @@ def test_get_field_metadata_fallback_to_model_fields():
 def test_get_field_metadata_field_not_in_model_returns_none():
     """get_field_metadata returns None for non-existent field."""
     assert get_field_metadata(User, "nonexistent") is None
+
+
+def test_type_hints_cached_per_model():
+    """Type hints are resolved once per model class and reused."""
+    from semblance.links import _cached_type_hints
+
+    assert _cached_type_hints(User) is _cached_type_hints(User)
+    assert get_field_metadata(User, "name") == FromInput("name")
+
+
+def test_extract_link_from_annotation_accepts_link_subclasses():
+    """Subclasses of built-in links are still recognized as link metadata."""
+    from dataclasses import dataclass
+
+    from semblance.links import _extract_link_from_annotation
+
+    @dataclass(frozen=True)
+    class FromInputAlias(FromInput):
+        pass
+
+    meta = FromInputAlias("name")
+    assert _extract_link_from_annotation(Annotated[str, "doc", meta]) is meta
+    assert _extract_link_from_annotation(Annotated[str, "doc"]) is None
+    assert _extract_link_from_annotation(str) is None
+
+
+def test_link_dataclasses_are_slotted_and_intern_names():
+    """Built-in links use __slots__ and intern their field-name strings."""
+    field = "".join(["na", "me"])
+    link = FromInput(field)
+    assert not hasattr(link, "__dict__")
+    assert link.field is sys.intern("name")
+    assert FromInput("name") == link
+
+
+def test_when_input_interns_str_condition_values():
+    """WhenInput interns str condition values and leaves others untouched."""
+    from semblance.links import WhenInput
+
+    link = WhenInput("status", "".join(["act", "ive"]), FromInput("name"))
+    assert link.condition_value is sys.intern("active")
+    assert WhenInput("flag", True, FromInput("name")).condition_value is True
+
+
+def test_get_field_metadata_uses_cached_field_map():
+    """get_field_metadata answers model fields from the per-class link map."""
+    from semblance.links import _field_links
+    from semblance.plugins import registry_generation
+
+    class Out(BaseModel):
+        name: Annotated[str, FromInput("name")]
+        plain: int = 0
+
+    links = _field_links(Out, registry_generation())
+    assert links == {"name": FromInput("name"), "plain": None}
+    assert get_field_metadata(Out, "name") is links["name"]
+    assert get_field_metadata(Out, "missing") is None
@@ -53,6 +53,40 @@ class TestLoadApp:
         with pytest.raises(SystemExit):
             _load_app("tests.sample_app:")
 
+    def test_load_reuses_imported_module(self):
+        """A module that is already imported is reused, not executed again."""
+        import tests.sample_app
+
+        assert _load_target("tests.sample_app:api") is tests.sample_app.api
+        assert _load_app("tests.sample_app:api") is _load_app("tests.sample_app:api")
+
+    @pytest.mark.parametrize("preimported", [False, True])
+    def test_resolve_app_path_infers_plain_fastapi_module(
+        self, tmp_path, monkeypatch, preimported
+    ):
+        """A FastAPI-only module resolves on a cold import and when already imported."""
+        import importlib
+
+        from semblance.cli import _resolve_app_path
+
+        (tmp_path / "plain_fastapi_mod.py").write_text(
+            "from fastapi import FastAPI\n\napp = FastAPI()\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "plain_fastapi_mod", raising=False)
+        # Neither path may rely on fastapi having been imported by the caller.
+        monkeypatch.delitem(sys.modules, "fastapi")
+        module = None
+        if preimported:
+            module = importlib.import_module("plain_fastapi_mod")
+            # Reused as-is from sys.modules, even with fastapi dropped again.
+            monkeypatch.delitem(sys.modules, "fastapi")
+        assert _resolve_app_path("plain_fastapi_mod") == "plain_fastapi_mod:app"
+        target = _load_target("plain_fastapi_mod")
+        if module is not None:
+            assert target is module.app
+        monkeypatch.delitem(sys.modules, "plain_fastapi_mod")
+
     def test_resolve_app_path_infers_single_candidate(self):
         """When module has a single SemblanceAPI/FastAPI, run app works with module only."""
         # sample_app has both api and app, so we need a module with one. Use api explicitly.
@@ -1,8 +1,7 @@
 """Tests for Phase 5: PUT/PATCH/DELETE, rate limiting, response validation, property-based testing."""
 
-import time
+from types import SimpleNamespace
 
-import pytest
 from pydantic import BaseModel
 
 from semblance import SemblanceAPI
@@ -88,8 +87,12 @@ class TestRateLimit:
         assert r2.status_code == 200
         assert r3.status_code == 429
 
-    @pytest.mark.slow
-    def test_rate_limit_allows_after_window(self):
+    def test_rate_limit_allows_after_window(self, monkeypatch):
+        # Advance the limiter's clock only; the client's event loop keeps real time.
+        now = [100.0]
+        monkeypatch.setattr(
+            "semblance.rate_limit.time", SimpleNamespace(monotonic=lambda: now[0])
+        )
         api = SemblanceAPI()
         api.get(
             "/limited2",
@@ -101,7 +104,7 @@ class TestRateLimit:
         client = make_client(app)
         assert client.get("/limited2?name=a").status_code == 200
         assert client.get("/limited2?name=b").status_code == 429
-        time.sleep(1.1)
+        now[0] += 1.1
         assert client.get("/limited2?name=c").status_code == 200
 
 
@@ -86,6 +86,26 @@ def test_load_config_from_pyproject_toml(tmp_path):
     assert cfg.stateful is True
 
 
+def test_load_config_discovery_cached_per_cwd(tmp_path, monkeypatch):
+    """Discovery is cached, but callers get copies and file edits are seen."""
+    import os
+
+    yaml_path = tmp_path / "semblance.yaml"
+    yaml_path.write_text("seed: 7\n")
+    monkeypatch.chdir(tmp_path)
+    cfg = load_config()
+    assert cfg.seed == 7
+    cfg.seed = 1
+    assert load_config() is not cfg
+    assert load_config().seed == 7
+
+    yaml_path.write_text("seed: 8\n")
+    stat = yaml_path.stat()
+    # Bump mtime explicitly; the rewrite may land within the same clock tick.
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_config().seed == 8
+
+
 def test_semblance_api_uses_config_path(tmp_path):
     """SemblanceAPI(config_path=...) applies config defaults."""
     yaml_path = tmp_path / "semblance.yaml"
@@ -148,3 +168,31 @@ def test_semblance_property_per_endpoint(
         spec.output_annotation,
         validate_response=True,
     )
+
+
+def test_pytest_plugin_loads_app_once():
+    """_load_semblance_api caches per path and reuses already-imported modules."""
+    import tests.sample_app
+    from semblance.pytest_plugin import _load_semblance_api
+
+    api = _load_semblance_api("tests.sample_app:api")
+    assert api is tests.sample_app.api
+    assert _load_semblance_api("tests.sample_app:api") is api
+
+
+def test_config_imports_without_toml_parser(tmp_path):
+    """Without tomllib/tomli, semblance still imports and TOML config is skipped."""
+    import subprocess
+    import sys
+
+    toml_path = tmp_path / "pyproject.toml"
+    toml_path.write_text("[tool.semblance]\nseed = 42\n")
+    code = (
+        "import sys\n"
+        "sys.modules['tomllib'] = None\n"
+        "sys.modules['tomli'] = None\n"
+        "from semblance import SemblanceAPI\n"
+        "from semblance.config import load_config\n"
+        f"assert load_config({str(toml_path)!r}).seed is None\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -90,3 +90,25 @@ def test_custom_link_random_choice():
     assert r.status_code == 200
     data = r.json()
     assert data["choice"] in ("a", "b", "c")
+
+
+def test_register_link_invalidates_cached_resolution_plan():
+    """A link registered after a model was first resolved is picked up."""
+    from semblance.resolver import resolve_overrides
+
+    class Constant:
+        def __init__(self, value: str):
+            self.value = value
+
+        def resolve(self, input_data: dict, rng) -> str:
+            return self.value
+
+    class Query(BaseModel):
+        name: str = "alice"
+
+    class Out(BaseModel):
+        tag: Annotated[str, Constant("fixed")]
+
+    assert resolve_overrides(Out, Query, Query()) == {}
+    register_link(Constant)
+    assert resolve_overrides(Out, Query, Query()) == {"tag": "fixed"}
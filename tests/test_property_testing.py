@@ -77,3 +77,49 @@ class TestPropertyBased:
         msg = str(exc_info.value)
         assert "Reproduce with curl" in msg
         assert "Or Python" in msg
+
+    def test_test_endpoint_substitutes_path_params(self):
+        """Path params are filled into the URL for every drawn example."""
+        from semblance import SemblanceAPI
+        from semblance.property_testing import strategy_for_input_model, test_endpoint
+        from semblance.testing import test_client as make_client
+
+        api = SemblanceAPI(seed=1)
+        api.get("/users/{name}", input=UserQuery, output=User)(lambda: None)
+        client = make_client(api.as_fastapi())
+        test_endpoint(
+            client,
+            "GET",
+            "/users/{name}",
+            strategy_for_input_model(UserQuery),
+            User,
+            path_params={"name": "alice"},
+            invariants=(lambda _i, out: out["name"] == "alice",),
+        )
+
+    def test_test_endpoint_unsupported_method_raises_before_drawing(self):
+        """An unsupported method is rejected before any example is generated."""
+        from semblance.property_testing import strategy_for_input_model, test_endpoint
+
+        with pytest.raises(ValueError, match="Unsupported method"):
+            test_endpoint(
+                object(), "TRACE", "/users", strategy_for_input_model(UserQuery), User
+            )
+
+    def test_strategy_for_input_model_is_cached_per_model(self):
+        from semblance.property_testing import strategy_for_input_model
+
+        assert strategy_for_input_model(UserQuery) is strategy_for_input_model(
+            UserQuery, path_template="/users/{id}"
+        )
+
+    def test_get_bare_annotation_strips_optional_and_annotated(self):
+        from typing import Annotated, Optional
+
+        from semblance.property_testing import _get_bare_annotation
+
+        assert _get_bare_annotation(int | None) is int
+        assert _get_bare_annotation(Optional[str]) is str  # noqa: UP045
+        assert _get_bare_annotation(Annotated[int, "x"] | None) is int
+        assert _get_bare_annotation(Annotated[int, {}]) is int
+        assert _get_bare_annotation(list[int]) == list[int]
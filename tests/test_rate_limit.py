@@ -2,8 +2,6 @@
 
 import time
 
-import pytest
-
 from semblance.rate_limit import RateLimiter, get_limiter
 
 
@@ -23,12 +21,13 @@ class TestRateLimiter:
         assert limiter.check_and_record("/users", "GET", 2) is False
         assert limiter.check_and_record("/users", "GET", 2) is False
 
-    @pytest.mark.slow
-    def test_after_window_allows_again(self):
+    def test_after_window_allows_again(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
         limiter = RateLimiter()
         assert limiter.check_and_record("/a", "POST", 1) is True
         assert limiter.check_and_record("/a", "POST", 1) is False
-        time.sleep(1.1)
+        now[0] += 1.1
         assert limiter.check_and_record("/a", "POST", 1) is True
 
     def test_different_keys_independent(self):
@@ -38,14 +37,37 @@ class TestRateLimiter:
         assert limiter.check_and_record("/users", "POST", 1) is True
         assert limiter.check_and_record("/items", "GET", 1) is True
 
-    @pytest.mark.slow
-    def test_sliding_window_prunes_old_timestamps(self):
+    def test_sliding_window_prunes_old_timestamps(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
         limiter = RateLimiter()
         assert limiter.check_and_record("/x", "GET", 1) is True
-        time.sleep(1.1)
+        now[0] += 1.1
         assert limiter.check_and_record("/x", "GET", 1) is True
         assert limiter.check_and_record("/x", "GET", 1) is False
 
+    def test_window_expires_only_old_timestamps(self, monkeypatch):
+        clock = iter([0.0, 0.5, 1.0, 1.2, 1.3])
+        monkeypatch.setattr(time, "monotonic", lambda: next(clock))
+        limiter = RateLimiter()
+        assert limiter.check_and_record("/x", "GET", 2) is True  # t=0.0
+        assert limiter.check_and_record("/x", "GET", 2) is True  # t=0.5
+        assert limiter.check_and_record("/x", "GET", 2) is True  # t=1.0 drops 0.0
+        assert limiter.check_and_record("/x", "GET", 2) is False  # t=1.2
+        assert limiter.check_and_record("/x", "GET", 2) is False  # t=1.3
+
+    def test_concurrent_requests_respect_limit_per_key(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        limiter = RateLimiter()
+        keys = [("/a", "GET"), ("/b", "GET"), ("/c", "POST")] * 100
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            results = list(
+                ex.map(lambda k: (k, limiter.check_and_record(*k, 20)), keys)
+            )
+        for key in set(keys):
+            assert sum(ok for k, ok in results if k == key) == 20
+
 
 class TestGetLimiter:
     def test_get_limiter_returns_singleton(self):
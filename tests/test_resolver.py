@@ -5,8 +5,21 @@ from typing import Annotated
 
 from pydantic import BaseModel
 
-from semblance.links import FromCookie, FromHeader
+from semblance.links import (
+    ComputedFrom,
+    DateRangeFrom,
+    FromCookie,
+    FromHeader,
+    FromInput,
+    WhenInput,
+)
+from semblance.plugins import registry_generation
 from semblance.resolver import (
+    _compiled_resolver,
+    _get_nested_model,
+    _InputProxy,
+    _make_random_datetime_closure,
+    _no_overrides,
     _to_datetime,
     get_output_model_for_type,
     resolve_overrides,
@@ -154,3 +167,136 @@ def test_get_output_model_for_type_non_model_returns_none():
     """get_output_model_for_type returns None for non-BaseModel type."""
     assert get_output_model_for_type(str) is None
     assert get_output_model_for_type(int) is None
+
+
+def test_get_nested_model_handles_optional_and_unhashable_annotations():
+    """Nested-model lookup works for Optional models and unhashable annotations."""
+    assert _get_nested_model(User | None) is User
+    assert _get_nested_model(User) is User
+    assert _get_nested_model(Annotated[User, {}]) is User
+    assert _get_nested_model(Annotated[int, {}]) is None
+    assert _get_nested_model(str) is None
+
+
+def test_input_proxy_matches_model_dump():
+    """_InputProxy.get reads like model_dump().get without dumping for scalars."""
+
+    class Inner(BaseModel):
+        x: int = 1
+
+    class Input(BaseModel):
+        name: str = "a"
+        inner: Inner = Inner()
+        tags: list[Inner] = [Inner()]
+
+    proxy = _InputProxy(Input())
+    assert proxy.get("name") == "a"
+    assert proxy._data is None
+    assert proxy.get("inner") == {"x": 1}
+    assert proxy.get("tags") == [{"x": 1}]
+    assert proxy.get("model_fields") is None
+    assert proxy.get("missing", 5) == 5
+    assert proxy.to_dict() == Input().model_dump()
+
+
+def test_compiled_resolver_is_cached_per_model():
+    """The specialized resolver is built once and keeps ComputedFrom specs."""
+
+    class Input(BaseModel):
+        name: str = "bob"
+
+    class Output(BaseModel):
+        name: Annotated[str, FromInput("name")]
+        upper: Annotated[str, ComputedFrom(("name",), str.upper)]
+
+    resolver = _compiled_resolver(Output, registry_generation())
+    assert _compiled_resolver(Output, registry_generation()) is resolver
+    overrides = resolve_overrides(Output, Input, Input())
+    assert overrides["name"] == "bob"
+    assert overrides["upper"].fn is str.upper
+
+
+def test_resolve_overrides_plain_model_short_circuits():
+    """Models without links or nested models resolve to {} without a context."""
+
+    class Plain(BaseModel):
+        name: str
+        count: int
+
+    assert _compiled_resolver(Plain, registry_generation()) is _no_overrides
+    assert resolve_overrides(Plain, UserQuery, UserQuery(name="a")) == {}
+
+
+def test_random_datetime_closure_stays_in_range():
+    """DateRangeFrom closures sample within the range; empty ranges return start."""
+    import random
+
+    start, end = datetime(2024, 1, 1), datetime(2024, 1, 2)
+    fn = _make_random_datetime_closure(start, end, random.Random(1))
+    assert all(start <= fn() <= end for _ in range(20))
+    same = _make_random_datetime_closure(end, start, random.Random(1))
+    assert same() == end
+
+
+def test_nested_models_share_the_request_context():
+    """Nested overrides come from the nested model's compiled resolver."""
+
+    class Inner(BaseModel):
+        name: Annotated[str, FromInput("name")]
+
+    class Outer(BaseModel):
+        inner: Inner
+        plain: int
+
+    overrides = resolve_overrides(Outer, UserQuery, UserQuery(name="zed"), seed=3)
+    assert overrides["inner"].model is Inner
+    assert overrides["inner"].overrides == {"name": "zed"}
+    assert "plain" not in overrides
+
+
+def test_when_input_dispatches_inner_link_by_type():
+    """WhenInput resolves its inner link only when the condition holds."""
+
+    class Input(BaseModel):
+        flag: bool = True
+        status: str = "on"
+
+    class Output(BaseModel):
+        status: Annotated[str, WhenInput("flag", True, FromInput("status"))]
+        other: Annotated[str, WhenInput("flag", True, FromHeader("X-A"))]  # type: ignore[arg-type]
+
+    assert resolve_overrides(Output, Input, Input()) == {"status": "on"}
+    assert resolve_overrides(Output, Input, Input(flag=False)) == {}
+
+
+def test_get_output_model_for_type_unhashable_annotation():
+    """Unhashable annotations bypass the cache instead of raising."""
+    assert get_output_model_for_type(Annotated[User, {}]) is None
+    assert get_output_model_for_type(list[User]) is User
+
+
+def test_nested_date_ranges_are_deterministic_with_seed():
+    """Nested DateRangeFrom closures share the seeded RNG and repeat per seed."""
+
+    class Inner(BaseModel):
+        at: Annotated[datetime, DateRangeFrom("start_date", "end_date")]
+
+    class Outer(BaseModel):
+        at: Annotated[datetime, DateRangeFrom("start_date", "end_date")]
+        inner: Inner
+
+    def draw(seed):
+        overrides = resolve_overrides(Outer, UserQuery, UserQuery(), seed=seed)
+        return overrides["at"](), overrides["inner"].overrides["at"]()
+
+    first = draw(5)
+    assert first == draw(5)
+    assert first[0] != first[1]
+
+
+def test_to_datetime_caches_iso_strings():
+    """Repeated ISO strings are parsed once; invalid strings give None."""
+    first = _to_datetime("2024-06-15T14:30:00Z")
+    assert first is _to_datetime("2024-06-15T14:30:00Z")
+    assert first.utcoffset().total_seconds() == 0
+    assert _to_datetime("not a date") is None
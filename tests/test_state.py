@@ -93,3 +93,79 @@ def test_clear_none_removes_all():
     store.clear(None)
     assert store.get_all("/a") == []
     assert store.get_all("/b") == []
+
+
+def test_id_lookups_follow_add_update_and_remove():
+    """get_by_id/update/remove stay consistent with the id index."""
+
+    class Item(BaseModel):
+        id: str
+        name: str = ""
+
+    store = StatefulStore()
+    for i in range(3):
+        store.add("/items", Item(id=str(i)))
+    assert store.get_by_id("/items", "1").id == "1"
+    store.add("/items", Item(id="3"))
+    assert store.get_by_id("/items", "3").id == "3"
+    assert store.update("/items", "1", Item(id="9", name="x")).name == "x"
+    assert store.get_by_id("/items", "1") is None
+    assert store.get_by_id("/items", "9").name == "x"
+    assert store.remove("/items", "0")
+    assert store.get_by_id("/items", "2").id == "2"
+    assert store.get_by_id("/items", "0") is None
+    assert not store.remove("/missing", "0")
+
+
+def test_add_generates_id_for_optional_and_coerced_id_fields():
+    """Generated ids are copied into str ids and validated into other types."""
+    import uuid
+
+    class OptionalId(BaseModel):
+        id: str | None = None
+
+    class UuidId(BaseModel):
+        id: uuid.UUID | None = None
+
+    store = StatefulStore()
+    assert isinstance(store.add("/a", OptionalId()).id, str)
+    assert isinstance(store.add("/b", UuidId()).id, uuid.UUID)
+
+
+def test_get_all_json_caches_until_the_collection_changes():
+    """get_all_json serializes by alias, caches, and only for one item model."""
+    from pydantic import Field
+
+    class Item(BaseModel):
+        id: str
+        label: str = Field(default="", alias="Label")
+
+    class Other(BaseModel):
+        id: str
+
+    store = StatefulStore()
+    assert store.get_all_json("/items", Item) == b"[]"
+    store.add("/items", Item(id="1"))
+    payload = store.get_all_json("/items", Item)
+    assert payload == b'[{"id":"1","Label":""}]'
+    assert store.get_all_json("/items", Item) is payload
+    assert store.get_all_json("/items", Other) is None
+    store.remove("/items", "1")
+    assert store.get_all_json("/items", Item) == b"[]"
+    store.add("/items", Item(id="1"))
+    store.add("/items", Other(id="2"))
+    assert store.get_all_json("/items", Item) is None
+
+
+def test_get_all_json_declines_non_finite_floats():
+    """NaN/inf items are left to the regular response path, which rejects them."""
+
+    class Reading(BaseModel):
+        id: str
+        value: float | None = None
+
+    store = StatefulStore()
+    store.add("/readings", Reading(id="1"))
+    assert store.get_all_json("/readings", Reading) == b'[{"id":"1","value":null}]'
+    store.add("/readings", Reading(id="2", value=float("nan")))
+    assert store.get_all_json("/readings", Reading) is None
@@ -103,3 +103,42 @@ def test_validate_specs_invalid_computed_from_missing_dependency():
     assert len(errors) == 1
     assert "nonexistent" in errors[0]
     assert "ComputedFrom" in errors[0]
+
+
+def test_has_links_detects_links_and_nested_models():
+    """_has_links is False only for models without links or nested models."""
+    from typing import Annotated
+
+    from semblance.plugins import registry_generation
+    from semblance.validation import _has_links
+
+    class Plain(BaseModel):
+        name: str
+
+    class Wrapper(BaseModel):
+        inner: Plain
+
+    class Linked(BaseModel):
+        name: Annotated[str, FromInput("name")]
+
+    assert not _has_links(Plain, registry_generation())
+    assert _has_links(Wrapper, registry_generation())
+    assert _has_links(Linked, registry_generation())
+
+
+def test_duplicate_endpoint_errors_normalize_method_case():
+    """Methods differing only in case are duplicates; each key is reported once."""
+    from types import SimpleNamespace
+
+    from semblance.validation import get_duplicate_endpoint_errors
+
+    specs = [
+        SimpleNamespace(path="/x", methods=["GET"]),
+        SimpleNamespace(path="/x", methods=["get"]),
+        SimpleNamespace(path="/x", methods=[None]),
+        SimpleNamespace(path="/y", methods=["POST"]),
+    ]
+    assert get_duplicate_endpoint_errors(specs) == [
+        "Duplicate GET endpoint registered for path '/x' (3 registrations). "
+        "Register only one handler per (path, method)."
+    ]